@@ -0,0 +1,22 @@
+"""Validation helpers shared across the framework."""
+
+
+def validate_text(value, label: str = "Text") -> None:
+    """
+    Validate that a value is a non-empty string.
+    
+    Args:
+        value: The value to validate
+        label: Name of the value used in error messages (e.g. "Text", "Prompt")
+        
+    Raises:
+        ValueError: If the value is None, not a string, or empty/whitespace only
+    """
+    if value is None:
+        raise ValueError(f"{label} cannot be None")
+    
+    if not isinstance(value, str):
+        raise ValueError(f"{label} must be a string, got {type(value).__name__}")
+    
+    if not value.strip():
+        raise ValueError(f"{label} cannot be empty or whitespace only")
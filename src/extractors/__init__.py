@@ -2,11 +2,15 @@
 Extractor module containing field extractor implementations.
 """
 
-from .field_extractor import FieldExtractor
+from .field_extractor import BaseFieldExtractor, FieldExtractor
 from .name_extractor import NameExtractor
 from .email_extractor import EmailExtractor
 from .skills_extractor import SkillsExtractor
 from .resume_extractor import ResumeExtractor
+from .batched_resume_extractor import BatchedResumeExtractor
+from .bulk_resume_extractor import BulkResumeExtractor
 
-__all__ = ['FieldExtractor', 'NameExtractor', 'EmailExtractor', 'SkillsExtractor', 'ResumeExtractor']
-
+__all__ = [
+    'FieldExtractor', 'BaseFieldExtractor', 'NameExtractor', 'EmailExtractor', 'SkillsExtractor',
+    'ResumeExtractor', 'BatchedResumeExtractor', 'BulkResumeExtractor'
+]
@@ -0,0 +1,205 @@
+"""
+Batched resume extractor that extracts all supported fields
+with a single structured-output LLM call.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Type
+
+from pydantic import BaseModel, ValidationError, create_model
+
+from .field_extractor import PROMPT_PREFIX, BaseFieldExtractor, FieldExtractor
+from .resume_extractor import ResumeExtractor
+from ..models.resume import ResumeData
+from ..llm.llm_interface import LLMInterface
+
+logger = logging.getLogger(__name__)
+
+
+class BatchedResumeExtractor(ResumeExtractor):
+    """
+    Extracts all resume fields with one structured-output LLM call.
+    
+    The response schema is assembled from the schema_fragment of each
+    BaseFieldExtractor, so new fields remain pluggable. Other extractors and
+    those without a schema_fragment are run individually, and the individual extractors are
+    used as a fallback if the structured response cannot be validated.
+    """
+    
+    def __init__(self, extractors: Dict[str, FieldExtractor], llm_interface: LLMInterface, max_retries: int = 2,
+                 retry_backoff: float = 0.0, min_text_chars: int = 50, require_resume_keywords: bool = False):
+        """
+        Initialize the BatchedResumeExtractor.
+        
+        Args:
+            extractors: Dictionary mapping field names to FieldExtractor instances.
+                      Expected keys: 'name', 'email', 'skills'
+            llm_interface: LLM interface to use for field extraction
+            max_retries: Number of times to ask the LLM to fix a response that
+                        fails schema validation before falling back to the
+                        individual extractors (default: 2)
+            retry_backoff: Seconds to wait before retry n, multiplied by n
+                          (default: 0.0, retry immediately)
+            min_text_chars: Minimum printable characters for a text to be sent to the
+                          LLM, as for ResumeExtractor (default: 50)
+            require_resume_keywords: Skip texts without resume headings, as for
+                                   ResumeExtractor (default: False)
+        
+        Raises:
+            ValueError: If extractors dictionary is empty
+        """
+        super().__init__(extractors, llm_interface, min_text_chars=min_text_chars,
+                         require_resume_keywords=require_resume_keywords)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.batched_fields = [
+            field_name for field_name, extractor in extractors.items()
+            if isinstance(extractor, BaseFieldExtractor) and extractor.schema_fragment is not None
+        ]
+        self.response_schema = self._build_response_schema()
+    
+    def _build_response_schema(self) -> Optional[Type[BaseModel]]:
+        """Assemble the combined response schema from the extractors' schema fragments."""
+        if not self.batched_fields:
+            return None
+        return create_model(
+            'ResumeFields',
+            **{field_name: self.extractors[field_name].schema_fragment for field_name in self.batched_fields}
+        )
+    
+    def _build_prompt(self, text: str) -> str:
+        """Build the prompt asking for all batched fields as a single JSON object."""
+        field_list = ', '.join(self.batched_fields)
+        return (
+            f"{PROMPT_PREFIX}{text}\n\n"
+            f"Task: Extract the following fields of the candidate from the resume text above: {field_list}. "
+            "Return only a JSON object matching the provided schema, using null for any field that cannot be found."
+        )
+    
+    def _generate_structured(self, text: str) -> Optional[BaseModel]:
+        """
+        Request the batched fields from the LLM, retrying with validation feedback.
+        
+        Each failed attempt is kept in the conversation history together with the
+        validation error, so the model can fix its previous answer rather than
+        starting over.
+        
+        Args:
+            text: The text content to extract resume information from
+        
+        Returns:
+            The validated structured response, or None if every attempt failed validation
+        """
+        prompt = self._build_prompt(text)
+        history = []
+        for attempt in range(self.max_retries + 1):
+            if attempt and self.retry_backoff:
+                time.sleep(self.retry_backoff * attempt)
+            response = self.llm_interface.generate_response(
+                prompt,
+                response_mime_type='application/json',
+                response_schema=self.response_schema,
+                **({'history': list(history)} if history else {})
+            )
+            try:
+                structured = self.response_schema.model_validate_json(response or '')
+            except ValidationError as e:
+                logger.warning(f"Structured response failed validation (attempt {attempt + 1}): {e}")
+                history.extend((('user', prompt), ('model', response or '')))
+                prompt = (
+                    f"Your previous response failed validation with the following error:\n{e}\n"
+                    "Fix the error and return only valid JSON matching the schema."
+                )
+                continue
+            if attempt:
+                logger.info(f"Structured response validated after {attempt} retries")
+            return structured
+        logger.warning(f"Structured response failed validation after {self.max_retries} retries")
+        return None
+    
+    def extract(self, text: str) -> ResumeData:
+        """
+        Extract all resume fields from the given text and create a ResumeData
+        instance, using a single structured LLM call for the batched fields.
+        
+        The structured call and the extractors without a schema_fragment are run
+        concurrently on worker threads, without starting an event loop.
+        
+        Args:
+            text: The text content to extract resume information from
+        
+        Returns:
+            A ResumeData instance with extracted fields
+        
+        Raises:
+            ValueError: If the input text is invalid
+        """
+        if not text or not isinstance(text, str) or not text.strip():
+            raise ValueError("Text cannot be empty or None")
+        
+        if self.response_schema is None:
+            return super().extract(text)
+        
+        if self.is_degenerate(text):
+            return ResumeData(name='', email='', skills=[])
+        
+        logger.info(f"Extracting {len(self.batched_fields)} fields in a single LLM call ({len(text)} characters)")
+        remaining_fields = [field_name for field_name in self.extractors if field_name not in self.batched_fields]
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            structured_future = executor.submit(self._generate_structured, text)
+            extracted_fields = self.extract_fields(text, remaining_fields)
+            structured = structured_future.result()
+        if structured is None:
+            logger.warning("Structured extraction failed, falling back to individual field extractors")
+            extracted_fields.update(self.extract_fields(text, self.batched_fields))
+        else:
+            extracted_fields.update(self._structured_fields(structured))
+        
+        return self.build_resume_data(extracted_fields)
+    
+    async def extract_async(self, text: str) -> ResumeData:
+        """
+        Asynchronously extract all resume fields from the given text and create a
+        ResumeData instance, using a single structured LLM call for the batched fields.
+        
+        Args:
+            text: The text content to extract resume information from
+        
+        Returns:
+            A ResumeData instance with extracted fields
+        
+        Raises:
+            ValueError: If the input text is invalid
+        """
+        if not text or not isinstance(text, str) or not text.strip():
+            raise ValueError("Text cannot be empty or None")
+        
+        if self.response_schema is None:
+            return await super().extract_async(text)
+        
+        if self.is_degenerate(text):
+            return ResumeData(name='', email='', skills=[])
+        
+        logger.info(f"Extracting {len(self.batched_fields)} fields in a single LLM call ({len(text)} characters)")
+        remaining_fields = [field_name for field_name in self.extractors if field_name not in self.batched_fields]
+        structured, extracted_fields = await asyncio.gather(
+            asyncio.to_thread(self._generate_structured, text),
+            self.extract_fields_async(text, remaining_fields)
+        )
+        if structured is None:
+            logger.warning("Structured extraction failed, falling back to individual field extractors")
+            extracted_fields.update(await self.extract_fields_async(text, self.batched_fields))
+        else:
+            extracted_fields.update(self._structured_fields(structured))
+        
+        return self.build_resume_data(extracted_fields)
+    
+    def _structured_fields(self, structured: BaseModel) -> Dict[str, Any]:
+        """Convert the batched fields of a validated structured response into field values."""
+        return {
+            field_name: self.extractors[field_name].from_structured(getattr(structured, field_name))
+            for field_name in self.batched_fields
+        }
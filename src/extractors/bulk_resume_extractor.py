@@ -0,0 +1,153 @@
+"""
+Bulk resume extractor that extracts the fields of several resumes
+with a single structured-output LLM call.
+"""
+
+import logging
+from typing import Dict, List
+
+from pydantic import TypeAdapter, ValidationError, create_model
+
+from .batched_resume_extractor import BatchedResumeExtractor
+from .field_extractor import FieldExtractor
+from ..models.resume import ResumeData
+from ..llm.llm_interface import LLMInterface
+
+logger = logging.getLogger(__name__)
+
+# Output tokens allowed per resume for its id and the JSON punctuation around its fields.
+_ITEM_OVERHEAD_TOKENS = 16
+
+
+class BulkResumeExtractor:
+    """
+    Extracts resume fields for many resumes, packing up to batch_size resumes
+    into each structured-output LLM call.
+    
+    Each resume is tagged with an id in the prompt, which is used to restore the
+    input order. Resumes missing from (or invalid in) a bulk response fall back to
+    the single-resume BatchedResumeExtractor path.
+    """
+    
+    def __init__(self, extractors: Dict[str, FieldExtractor], llm_interface: LLMInterface,
+                 batch_size: int = 4, max_retries: int = 2, min_text_chars: int = 50,
+                 require_resume_keywords: bool = False):
+        """
+        Initialize the BulkResumeExtractor.
+        
+        Args:
+            extractors: Dictionary mapping field names to FieldExtractor instances.
+                      Expected keys: 'name', 'email', 'skills'
+            llm_interface: LLM interface to use for field extraction
+            batch_size: Maximum number of resumes sent in a single LLM call (default: 4)
+            max_retries: Validation retries used by the single-resume fallback (default: 2)
+            min_text_chars: Minimum printable characters for a text to be sent to the
+                          LLM, as for ResumeExtractor (default: 50)
+            require_resume_keywords: Skip texts without resume headings, as for
+                                   ResumeExtractor (default: False)
+        
+        Raises:
+            ValueError: If extractors dictionary is empty, batch_size is not positive,
+                       or none of the extractors define a schema_fragment
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.resume_extractor = BatchedResumeExtractor(
+            extractors, llm_interface, max_retries=max_retries,
+            min_text_chars=min_text_chars, require_resume_keywords=require_resume_keywords
+        )
+        if self.resume_extractor.response_schema is None:
+            raise ValueError("At least one extractor must define a schema_fragment")
+        self.batch_size = batch_size
+        self.llm_interface = llm_interface
+        item_schema = create_model('IdentifiedResumeFields', id=(int, ...), __base__=self.resume_extractor.response_schema)
+        self.response_schema = List[item_schema]
+        self._response_adapter = TypeAdapter(self.response_schema)
+        field_tokens = [
+            getattr(self.resume_extractor.extractors[field_name], 'max_output_tokens', None)
+            for field_name in self.resume_extractor.batched_fields
+        ]
+        # The whole batch is answered in one response, so the output cap grows with
+        # the batch; without a limit for every field the LLM's default is used.
+        self._tokens_per_resume = (
+            sum(field_tokens) + _ITEM_OVERHEAD_TOKENS
+            if all(isinstance(tokens, int) for tokens in field_tokens) else None
+        )
+    
+    def _build_prompt(self, texts: List[str]) -> str:
+        """Build the prompt asking for the batched fields of every resume as a JSON array."""
+        resumes = '\n'.join(f"---RESUME id={index}---\n{text}" for index, text in enumerate(texts))
+        field_list = ', '.join(self.resume_extractor.batched_fields)
+        return (
+            f"{resumes}\n---END OF RESUMES---\n\n"
+            "Task: For each resume above, extract the following fields of the candidate: "
+            f"{field_list}. Return only a JSON array with one object per resume containing its id and "
+            "these fields, using null for any field that cannot be found."
+        )
+    
+    def _extract_batch(self, texts: List[str]) -> List[ResumeData]:
+        """Extract one batch of resumes, falling back to single-resume extraction where needed."""
+        structured_by_id = {}
+        kwargs = {}
+        if self._tokens_per_resume is not None:
+            kwargs['max_output_tokens'] = self._tokens_per_resume * len(texts)
+        response = self.llm_interface.generate_response(
+            self._build_prompt(texts),
+            response_mime_type='application/json',
+            response_schema=self.response_schema,
+            **kwargs
+        )
+        try:
+            structured_by_id = {item.id: item for item in self._response_adapter.validate_json(response or '')}
+        except ValidationError as e:
+            logger.warning(f"Bulk structured response failed validation, falling back to single-resume extraction: {e}")
+        
+        extractors = self.resume_extractor.extractors
+        batched_fields = self.resume_extractor.batched_fields
+        remaining_fields = [field_name for field_name in extractors if field_name not in batched_fields]
+        structured_indices = [index for index in range(len(texts)) if index in structured_by_id]
+        # The remaining fields of every resume in the batch share one worker pool.
+        remaining_by_index = dict(zip(structured_indices, self.resume_extractor.extract_fields_many(
+            [texts[index] for index in structured_indices], remaining_fields
+        )))
+        resumes = []
+        for index, text in enumerate(texts):
+            structured = structured_by_id.get(index)
+            if structured is None:
+                logger.debug(f"Resume id={index} missing from bulk response, extracting individually")
+                resumes.append(self.resume_extractor.extract(text))
+                continue
+            extracted_fields = {
+                field_name: extractors[field_name].from_structured(getattr(structured, field_name))
+                for field_name in batched_fields
+            }
+            extracted_fields.update(remaining_by_index[index])
+            resumes.append(self.resume_extractor.build_resume_data(extracted_fields))
+        return resumes
+    
+    def extract(self, texts: List[str]) -> List[ResumeData]:
+        """
+        Extract resume fields from each of the given texts.
+        
+        Args:
+            texts: The text content of each resume
+        
+        Returns:
+            A list of ResumeData instances in the same order as texts
+        
+        Raises:
+            ValueError: If any input text is invalid
+        """
+        for text in texts:
+            if not text or not isinstance(text, str) or not text.strip():
+                raise ValueError("Text cannot be empty or None")
+        
+        resumes = [ResumeData(name='', email='', skills=[]) for _ in texts]
+        indices = [index for index, text in enumerate(texts) if not self.resume_extractor.is_degenerate(text)]
+        logger.info(f"Extracting fields from {len(indices)} resumes in batches of {self.batch_size}")
+        for start in range(0, len(indices), self.batch_size):
+            batch_indices = indices[start:start + self.batch_size]
+            batch = self._extract_batch([texts[index] for index in batch_indices])
+            for index, resume in zip(batch_indices, batch):
+                resumes[index] = resume
+        return resumes
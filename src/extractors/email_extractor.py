@@ -3,19 +3,59 @@ Email field extractor implementation.
 Handles extraction of email address from resume text.
 """
 
+import re
 from typing import Optional
 
-from .field_extractor import FieldExtractor
+from pydantic import Field
+
+from .field_extractor import PROMPT_PREFIX, BaseFieldExtractor
 from ..llm.llm_interface import LLMInterface
 
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", re.ASCII)
+
+_EMAIL_PROMPT_SUFFIX = (
+    "\n\nTask: Extract the email address from the resume text above. "
+    "Return only the email address, no other text or formatting."
+)
+
 
-class EmailExtractor(FieldExtractor):
+class EmailExtractor(BaseFieldExtractor):
     """Extractor for email address from resume text."""
     
+    schema_fragment = (Optional[str], Field(None, description="The email address of the candidate"))
+    max_context_chars = 1200
+    max_output_tokens = 32
+    
     def extract(self, text: str, llm_interface: LLMInterface) -> Optional[str]:
         """
         Extract the email address from the given text.
         
+        A regular expression is tried first; the LLM is only used when the
+        text contains no recognizable email address.
+        
+        Args:
+            text: The text content to extract the email from
+            llm_interface: The LLM interface to use for extraction
+            
+        Returns:
+            The extracted email address, or None if the email cannot be found
+            
+        Raises:
+            ValueError: If the input text is invalid
+        """
+        self.validate_text(text)
+        
+        match = _EMAIL_RE.search(text)
+        if match:
+            return match.group(0)
+        
+        return super().extract(text, llm_interface)
+    
+    async def extract_async(self, text: str, llm_interface: LLMInterface) -> Optional[str]:
+        """
+        Asynchronously extract the email address from the given text, trying the
+        regular expression before the LLM as extract() does.
+        
         Args:
             text: The text content to extract the email from
             llm_interface: The LLM interface to use for extraction
@@ -28,8 +68,13 @@ class EmailExtractor(FieldExtractor):
         """
         self.validate_text(text)
         
-        prompt = f"You will be provided the text of a resume. Extract the email address from the text. Return only the email address, no other text or formatting.\nResume text:/n{text}"
-        response = llm_interface.generate_response(prompt)
+        match = _EMAIL_RE.search(text)
+        if match:
+            return match.group(0)
         
-        return response if response else None
+        return await super().extract_async(text, llm_interface)
+    
+    def build_prompt(self, text: str) -> str:
+        """Build the prompt asking for the email address."""
+        return "".join((PROMPT_PREFIX, self.select_context(text), _EMAIL_PROMPT_SUFFIX))
 
@@ -1,16 +1,39 @@
-"""Abstract base class for field extractors."""
+"""Protocol and base class for field extractors."""
 
-from abc import ABC, abstractmethod
-from typing import Optional, TYPE_CHECKING
+import asyncio
+import inspect
+from typing import Any, Optional, Protocol, TYPE_CHECKING, runtime_checkable
+
+from .._utils import validate_text
 
 if TYPE_CHECKING:
     from ..llm.llm_interface import LLMInterface
 
+# Every field prompt starts with the resume text, so the prompts of one resume
+# share a common prefix.
+PROMPT_PREFIX = "Resume text:\n"
+
+
+async def _generate_response_async(llm_interface: 'LLMInterface', prompt: str, **kwargs) -> str:
+    """Await the LLM's native async path, or run generate_response() in a worker thread if it has none."""
+    generate_response_async = getattr(llm_interface, 'generate_response_async', None)
+    if inspect.iscoroutinefunction(generate_response_async):
+        return await generate_response_async(prompt, **kwargs)
+    return await asyncio.to_thread(llm_interface.generate_response, prompt, **kwargs)
 
-class FieldExtractor(ABC):
-    """Abstract base class for extracting specific fields from text."""
+
+@runtime_checkable
+class FieldExtractor(Protocol):
+    """
+    Protocol for extracting specific fields from text.
+    
+    Any object with an extract() method can be used as a field extractor. The
+    optional extract_async() and max_output_tokens of BaseFieldExtractor are
+    looked up with getattr() by their callers, so they are not part of the
+    protocol. Only BaseFieldExtractor subclasses with a schema_fragment take
+    part in structured (batched) extraction.
+    """
     
-    @abstractmethod
     def extract(self, text: str, llm_interface: 'LLMInterface'):
         """
         Extract a specific field from the given text.
@@ -26,16 +49,137 @@ class FieldExtractor(ABC):
         Raises:
             ValueError: If the input text is invalid
         """
-        pass  # pragma: no cover
+        ...  # pragma: no cover
+
+
+class BaseFieldExtractor(FieldExtractor):
+    """
+    Base class providing the optional field extractor attributes and default
+    implementations of the field extractor hooks.
+    
+    Concrete extractors subclass this and implement build_prompt(), and
+    parse_response() if the LLM's answer needs converting.
+    """
+    
+    # Pydantic field definition ``(type, FieldInfo)`` describing this field in a
+    # combined structured-output schema. Extractors that leave this as None are
+    # always run individually.
+    schema_fragment: Optional[tuple] = None
+    
+    # Maximum number of characters of the resume text embedded in the prompt,
+    # or None to send the full text.
+    max_context_chars: Optional[int] = None
+    
+    # Upper bound on the number of tokens the LLM may generate for this field,
+    # or None to use the LLM interface's default.
+    max_output_tokens: Optional[int] = None
+    
+    def extract(self, text: str, llm_interface: 'LLMInterface'):
+        """
+        Extract a specific field from the given text by sending build_prompt(text)
+        to the LLM and converting the answer with parse_response().
+        
+        Args:
+            text: The text content to extract the field from
+            llm_interface: The LLM interface to use for extraction
+            
+        Returns:
+            The extracted field value, or None if the field cannot be found
+            
+        Raises:
+            ValueError: If the input text is invalid
+            NotImplementedError: If the extractor builds no prompt and does not override extract()
+        """
+        self.validate_text(text)
+        prompt = self.build_prompt(text)
+        if prompt is None:
+            raise NotImplementedError(f"{type(self).__name__} must implement build_prompt() or extract()")
+        
+        response = llm_interface.generate_response(prompt, **self._generation_kwargs())
+        return self.parse_response(response)
+    
+    async def extract_async(self, text: str, llm_interface: 'LLMInterface'):
+        """
+        Asynchronously extract a specific field from the given text.
+        
+        The default implementation sends build_prompt(text) through the LLM
+        interface's generate_response_async() and converts the answer with
+        parse_response(). Extractors that build no prompt have extract() run
+        in a worker thread instead.
+        
+        Args:
+            text: The text content to extract the field from
+            llm_interface: The LLM interface to use for extraction
+            
+        Returns:
+            The extracted field value, or None if the field cannot be found
+            
+        Raises:
+            ValueError: If the input text is invalid
+        """
+        self.validate_text(text)
+        prompt = self.build_prompt(text)
+        if prompt is None:
+            return await asyncio.to_thread(self.extract, text, llm_interface)
+        
+        response = await _generate_response_async(llm_interface, prompt, **self._generation_kwargs())
+        return self.parse_response(response)
+    
+    def _generation_kwargs(self) -> dict:
+        """Keyword arguments passed to the LLM with the prompt from build_prompt()."""
+        return {} if self.max_output_tokens is None else {'max_output_tokens': self.max_output_tokens}
+    
+    def build_prompt(self, text: str) -> Optional[str]:
+        """
+        Build the LLM prompt extracting this field from the given text.
+        
+        Args:
+            text: The validated text content to extract the field from
+            
+        Returns:
+            The prompt, or None if this extractor does not extract through a single prompt
+        """
+        return None
+    
+    def parse_response(self, response: Optional[str]):
+        """
+        Convert the LLM's answer to the prompt from build_prompt() into the field value.
+        
+        Args:
+            response: The response text returned by the LLM
+            
+        Returns:
+            The extracted field value, or None if the response is empty
+        """
+        return response if response else None
+    
+    def select_context(self, text: str) -> str:
+        """
+        Select the part of the text that is relevant for this field.
+        
+        Args:
+            text: The full text content
+            
+        Returns:
+            The text truncated to max_context_chars, if set
+        """
+        if self.max_context_chars is None:
+            return text
+        return text[:self.max_context_chars]
     
     def validate_text(self, text: str) -> None:
         """Validate that the input text is valid for extraction."""
-        if text is None:
-            raise ValueError("Text cannot be None")
-        
-        if not isinstance(text, str):
-            raise ValueError(f"Text must be a string, got {type(text).__name__}")
+        validate_text(text)
+    
+    def from_structured(self, value: Any):
+        """
+        Convert a value taken from a structured (JSON) LLM response into the
+        same form returned by extract().
         
-        if not text.strip():
-            raise ValueError("Text cannot be empty or whitespace only")
-
+        Args:
+            value: The raw value for this field from the structured response
+            
+        Returns:
+            The normalized field value, or None if the field is missing
+        """
+        return value if value else None
@@ -5,30 +5,24 @@ Handles extraction of candidate name from resume text.
 
 from typing import Optional
 
-from .field_extractor import FieldExtractor
-from ..llm.llm_interface import LLMInterface
+from pydantic import Field
 
+from .field_extractor import PROMPT_PREFIX, BaseFieldExtractor
 
-class NameExtractor(FieldExtractor):
+_NAME_PROMPT_SUFFIX = (
+    "\n\nTask: Extract the name of the candidate from the resume text above. "
+    "Return only the name, no other text or formatting."
+)
+
+
+class NameExtractor(BaseFieldExtractor):
     """Extractor for candidate name from resume text."""
     
-    def extract(self, text: str, llm_interface: LLMInterface) -> Optional[str]:
-        """
-        Extract the candidate's name from the given text.
-        
-        Args:
-            text: The text content to extract the name from
-            
-        Returns:
-            The extracted name, or None if the name cannot be found
-            
-        Raises:
-            ValueError: If the input text is invalid
-        """
-        self.validate_text(text)
-
-        prompt = f"You will be provided the text of a resume. Extract the name of the candidate from the text. Return only the name, no other text or formatting.\nResume text:/n{text}"
-        response = llm_interface.generate_response(prompt)
-        
-        return response if response else None
+    schema_fragment = (Optional[str], Field(None, description="The full name of the candidate"))
+    max_context_chars = 800
+    max_output_tokens = 32
+    
+    def build_prompt(self, text: str) -> str:
+        """Build the prompt asking for the candidate's name."""
+        return "".join((PROMPT_PREFIX, self.select_context(text), _NAME_PROMPT_SUFFIX))
 
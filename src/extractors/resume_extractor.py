@@ -3,19 +3,26 @@ Resume extractor that orchestrates multiple field extractors
 to create a complete ResumeData instance.
 """
 
+import asyncio
+import inspect
 import logging
-from typing import Dict, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 from .field_extractor import FieldExtractor
 from ..models.resume import ResumeData
 from ..llm.llm_interface import LLMInterface
 
 logger = logging.getLogger(__name__)
 
+_RESUME_KEYWORD_RE = re.compile(r"\b(?:experience|education|skills?|resume|cv|curriculum vitae)\b", re.IGNORECASE)
+
 
 class ResumeExtractor:
     """Orchestrates multiple field extractors to create a ResumeData instance."""
     
-    def __init__(self, extractors: Dict[str, FieldExtractor], llm_interface: LLMInterface):
+    def __init__(self, extractors: Dict[str, FieldExtractor], llm_interface: LLMInterface,
+                 min_text_chars: int = 50, require_resume_keywords: bool = False):
         """
         Initialize the ResumeExtractor with a dictionary of field extractors and an LLM interface.
         
@@ -23,6 +30,12 @@ class ResumeExtractor:
             extractors: Dictionary mapping field names to FieldExtractor instances.
                       Expected keys: 'name', 'email', 'skills'
             llm_interface: LLM interface to use for field extraction
+            min_text_chars: Texts with fewer printable, non-whitespace characters are
+                          treated as empty and skip the LLM (default: 50, 0 disables)
+            require_resume_keywords: Skip the LLM for texts that mention none of the
+                                   usual resume headings such as "experience",
+                                   "education" or "skills" (default: False, since
+                                   a resume may use none of them)
         
         Raises:
             ValueError: If extractors dictionary is empty
@@ -31,11 +44,19 @@ class ResumeExtractor:
             raise ValueError("Extractors dictionary cannot be empty")
         self.extractors = extractors
         self.llm_interface = llm_interface
+        self.min_text_chars = min_text_chars
+        self.require_resume_keywords = require_resume_keywords
         logger.debug(f"Initialized ResumeExtractor with {len(extractors)} field extractors")
     
     def extract(self, text: str) -> ResumeData:
         """
         Extract all resume fields from the given text and create a ResumeData instance.
+        Field extractors are run concurrently on worker threads, so the extraction
+        time is bounded by the slowest field rather than the sum of all fields.
+        
+        Only the extractors' synchronous extract() is used, so no event loop is
+        started and this is safe to call from any thread, including one that runs
+        an event loop; async code can await extract_async() instead.
         
         Args:
             text: The text content to extract resume information from
@@ -49,13 +70,166 @@ class ResumeExtractor:
         if not text or not isinstance(text, str) or not text.strip():
             raise ValueError("Text cannot be empty or None")
         
+        if self.is_degenerate(text):
+            return ResumeData(name='', email='', skills=[])
+        
         logger.info(f"Extracting fields from resume text ({len(text)} characters)")
-        extracted_fields = {}
-        for field_name, extractor in self.extractors.items():
+        extracted_fields = self.extract_fields(text, list(self.extractors))
+        
+        return self.build_resume_data(extracted_fields)
+    
+    async def extract_async(self, text: str) -> ResumeData:
+        """
+        Asynchronously extract all resume fields from the given text and create a
+        ResumeData instance, running the field extractors concurrently.
+        
+        Args:
+            text: The text content to extract resume information from
+        
+        Returns:
+            A ResumeData instance with extracted fields
+            
+        Raises:
+            ValueError: If the input text is invalid
+        """
+        if not text or not isinstance(text, str) or not text.strip():
+            raise ValueError("Text cannot be empty or None")
+        
+        if self.is_degenerate(text):
+            return ResumeData(name='', email='', skills=[])
+        
+        logger.info(f"Extracting fields from resume text ({len(text)} characters)")
+        extracted_fields = await self.extract_fields_async(text, list(self.extractors))
+        
+        return self.build_resume_data(extracted_fields)
+    
+    def is_degenerate(self, text: str) -> bool:
+        """
+        Check whether text is too sparse, or too unlike a resume, to be worth
+        sending to the LLM (e.g. a scanned PDF without a text layer).
+        
+        Args:
+            text: The text content to check
+        
+        Returns:
+            True if extraction should be skipped, False otherwise
+        """
+        printable = 0
+        for char in text:
+            if char.isprintable() and not char.isspace():
+                printable += 1
+                if printable >= self.min_text_chars:
+                    break
+        if printable < self.min_text_chars:
+            logger.warning(f"Degenerate text ({printable} printable characters), skipping LLM extraction")
+            return True
+        
+        if self.require_resume_keywords and not _RESUME_KEYWORD_RE.search(text):
+            logger.warning("Text does not look like a resume, skipping LLM extraction")
+            return True
+        
+        return False
+    
+    def extract_fields(self, text: str, field_names: List[str]) -> Dict[str, Any]:
+        """
+        Run the synchronous extract() of the given fields' extractors concurrently
+        on worker threads.
+        
+        Args:
+            text: The text content to extract the fields from
+            field_names: Names of the fields to extract
+        
+        Returns:
+            Dictionary mapping field names to extracted values
+        """
+        return self.extract_fields_many([text], field_names)[0]
+    
+    def extract_fields_many(self, texts: List[str], field_names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Run the synchronous extract() of the given fields' extractors for several
+        texts concurrently, sharing one pool of worker threads.
+        
+        Args:
+            texts: The text contents to extract the fields from
+            field_names: Names of the fields to extract from each text
+        
+        Returns:
+            One dictionary mapping field names to extracted values per text, in the
+            same order as texts
+        """
+        if not texts or not field_names:
+            return [{} for _ in texts]
+        for field_name in field_names:
             logger.debug(f"Extracting field: {field_name}")
-            extracted_value = extractor.extract(text, self.llm_interface)
-            extracted_fields[field_name] = extracted_value
+        with ThreadPoolExecutor(max_workers=len(texts) * len(field_names)) as executor:
+            futures = [
+                {
+                    field_name: executor.submit(self.extractors[field_name].extract, text, self.llm_interface)
+                    for field_name in field_names
+                }
+                for text in texts
+            ]
+        
+        results = []
+        for text_futures in futures:
+            extracted_fields = {}
+            for field_name, future in text_futures.items():
+                error = future.exception()
+                if error is not None:
+                    logger.error(f"Error extracting field '{field_name}': {error}")
+                    raise error
+                extracted_fields[field_name] = future.result()
+            results.append(extracted_fields)
+        return results
+    
+    async def extract_fields_async(self, text: str, field_names: List[str]) -> Dict[str, Any]:
+        """
+        Run the extractors for the given fields concurrently on the running event loop.
         
+        Extractors providing a coroutine extract_async() are awaited directly; for
+        any other object implementing extract(), extract() is offloaded to a worker
+        thread.
+        
+        Args:
+            text: The text content to extract the fields from
+            field_names: Names of the fields to extract
+        
+        Returns:
+            Dictionary mapping field names to extracted values
+        """
+        for field_name in field_names:
+            logger.debug(f"Extracting field: {field_name}")
+        results = await asyncio.gather(
+            *[self._extract_field_async(self.extractors[field_name], text) for field_name in field_names],
+            return_exceptions=True
+        )
+        
+        extracted_fields = {}
+        for field_name, result in zip(field_names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error extracting field '{field_name}': {result}")
+                raise result
+            extracted_fields[field_name] = result
+        return extracted_fields
+    
+    def _extract_field_async(self, extractor: FieldExtractor, text: str):
+        """Return an awaitable extracting one field, using the extractor's native async path if it has one."""
+        extract_async = getattr(extractor, 'extract_async', None)
+        if inspect.iscoroutinefunction(extract_async):
+            return extract_async(text, self.llm_interface)
+        return asyncio.to_thread(extractor.extract, text, self.llm_interface)
+    
+    def build_resume_data(self, extracted_fields: Dict[str, Any]) -> ResumeData:
+        """
+        Create a ResumeData instance from extracted field values, replacing
+        missing values with defaults.
+        
+        Args:
+            extracted_fields: Dictionary mapping field names to extracted values
+        
+        Returns:
+            A ResumeData instance with extracted fields
+        """
         # Handle None values - convert to defaults
         name = extracted_fields.get('name')
         if name is None:
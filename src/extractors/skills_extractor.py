@@ -3,33 +3,88 @@ Skills field extractor implementation.
 Handles extraction of skills from resume text.
 """
 
-from typing import Optional, List
+import re
+from typing import Any, Optional, List
 
-from .field_extractor import FieldExtractor
-from ..llm.llm_interface import LLMInterface
+from pydantic import Field
 
+from .field_extractor import PROMPT_PREFIX, BaseFieldExtractor
 
-class SkillsExtractor(FieldExtractor):
+_SKILLS_HEADING_RE = re.compile(r"\bskills?\b", re.IGNORECASE)
+_SKILL_SEPARATOR_RE = re.compile(r"[,;\n]")
+
+_SKILLS_PROMPT_SUFFIX = (
+    "\n\nTask: Extract the skills of the candidate from the resume text above. "
+    "Return only the skills separated by commas with no spaces, no other text or formatting. "
+    "Here is an example of the expected format: 'Python,Java,SQL'"
+)
+
+
+def _normalize_skills(skills) -> Optional[List[str]]:
+    """Strip skills and drop empty and duplicate entries, preserving order."""
+    unique_skills = list(dict.fromkeys(skill.strip() for skill in skills if skill and skill.strip()))
+    return unique_skills if unique_skills else None
+
+
+class SkillsExtractor(BaseFieldExtractor):
     """Extractor for skills from resume text."""
     
-    def extract(self, text: str, llm_interface: LLMInterface) -> Optional[List[str]]:
+    schema_fragment = (Optional[List[str]], Field(None, description="The skills of the candidate"))
+    max_context_chars = 8000
+    max_output_tokens = 512
+    # When the text is too long, keep this much of the start of the resume plus
+    # section_chars from the first mention of skills.
+    head_chars = 2000
+    section_chars = 4000
+    
+    def build_prompt(self, text: str) -> str:
+        """Build the prompt asking for the candidate's skills as a comma-separated list."""
+        return "".join((PROMPT_PREFIX, self.select_context(text), _SKILLS_PROMPT_SUFFIX))
+    
+    def parse_response(self, response: Optional[str]) -> Optional[List[str]]:
         """
-        Extract skills from the given text.
+        Split the LLM's comma-separated answer into skills.
         
         Args:
-            text: The text content to extract skills from
+            response: The response text returned by the LLM
             
         Returns:
-            The extracted skills (comma-separated or formatted string), 
-            or None if skills cannot be found
+            The list of unique skills, or None if there are none
+        """
+        return _normalize_skills(_SKILL_SEPARATOR_RE.split(response)) if response else None
+    
+    def select_context(self, text: str) -> str:
+        """
+        Select the part of the text that is relevant for skills extraction.
+        
+        Short texts are returned unchanged. For long texts, if a skills section
+        appears beyond the start of the resume, the start of the resume is kept
+        together with the text following the first mention of skills; otherwise
+        the text is truncated to max_context_chars.
+        
+        Args:
+            text: The full text content
             
-        Raises:
-            ValueError: If the input text is invalid
+        Returns:
+            The selected context
         """
-        self.validate_text(text)
-
-        prompt = f"You will be provided the text of a resume. Extract the skills of the candidate from the text. Return only the skills separated by commas with no spaces, no other text or formatting.Here is an example of the expected format: 'Python,Java,SQL'\nResume text:/n{text}"
-        response = llm_interface.generate_response(prompt)
-
-        return [skill.strip() for skill in response.split(',')] if response else None
-
+        if len(text) <= self.max_context_chars:
+            return text
+        
+        match = _SKILLS_HEADING_RE.search(text)
+        if match and match.start() >= self.head_chars:
+            section = text[match.start():match.start() + self.section_chars]
+            return f"{text[:self.head_chars]}\n...\n{section}"
+        return text[:self.max_context_chars]
+    
+    def from_structured(self, value: Any) -> Optional[List[str]]:
+        """
+        Normalize a skills list taken from a structured LLM response.
+        
+        Args:
+            value: The raw skills list from the structured response
+            
+        Returns:
+            The list of stripped, unique, non-empty skills, or None if there are none
+        """
+        return _normalize_skills(value) if value else None
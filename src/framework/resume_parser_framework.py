@@ -2,22 +2,49 @@
 Resume Parser Framework that combines file parsing and field extraction.
 """
 
+import dataclasses
+import hashlib
+import json
 import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Union
 from ..parsers.file_parser import FileParser
 from ..parsers.pdf_parser import PDFParser
 from ..parsers.word_parser import WordParser
 from ..extractors.resume_extractor import ResumeExtractor
 from ..models.resume import ResumeData
+from ..llm.cache import PROMPT_VERSION
 
 logger = logging.getLogger(__name__)
 
+# Extractor settings that change the extracted ResumeData and so are part of the cache key.
+_RESUME_EXTRACTOR_SETTINGS = ('min_text_chars', 'require_resume_keywords', 'max_retries')
+_FIELD_EXTRACTOR_SETTINGS = ('max_context_chars', 'max_output_tokens')
+
+
+def _qualified_name(obj) -> str:
+    """Return the module-qualified class name of obj."""
+    return f"{type(obj).__module__}.{type(obj).__qualname__}"
+
+
+def _settings(obj, names) -> dict:
+    """Collect the plain (JSON) values of the named attributes of obj."""
+    settings = {}
+    for name in names:
+        value = getattr(obj, name, None)
+        if isinstance(value, (bool, int, float, str)):
+            settings[name] = value
+    return settings
+
 
 class ResumeParserFramework:
     """Main framework class that combines file parsing and resume extraction."""
     
-    def __init__(self, resume_extractor: ResumeExtractor, parsers: Optional[List[FileParser]] = None):
+    def __init__(self, resume_extractor: ResumeExtractor, parsers: Optional[List[FileParser]] = None,
+                 cache_dir: Optional[Union[str, Path]] = None):
         """
         Initialize the ResumeParserFramework.
         
@@ -25,6 +52,10 @@ class ResumeParserFramework:
             resume_extractor: ResumeExtractor instance to extract fields from text
             parsers: Optional list of FileParser instances. If not provided, defaults to
                     [PDFParser(), WordParser()]
+            cache_dir: Optional directory for caching parsed ResumeData keyed by the
+                      SHA-256 of the file content and the extraction setup. If provided,
+                      re-parsing an unchanged file skips both the file parser and the LLM
+                      extraction. Empty results are not cached, so they are retried
         
         Raises:
             ValueError: If parsers list is empty
@@ -37,6 +68,9 @@ class ResumeParserFramework:
         
         self.parsers = parsers
         self.resume_extractor = resume_extractor
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         logger.debug(f"Initialized ResumeParserFramework with {len(parsers)} parsers")
     
     def _select_parser(self, file_path: Path) -> FileParser:
@@ -85,9 +119,119 @@ class ResumeParserFramework:
         path = Path(file_path)
         
         file_parser = self._select_parser(path)
-        text = file_parser.parse(path)
+        if self.cache_dir is None:
+            text = file_parser.parse(path)
+        else:
+            file_parser.validate_file(path)
+            data = path.read_bytes()
+            cache_key = self._cache_key(data)
+            cached = self._load_cached_resume(cache_key)
+            if cached is not None:
+                logger.info(f"Loaded cached resume for file: {file_path}")
+                return cached
+            text = file_parser.parse_bytes(data, path)
+        
         logger.debug(f"Extracted {len(text)} characters from file")
         resume = self.resume_extractor.extract(text)
         logger.info(f"Successfully parsed resume")
         
+        if self.cache_dir is not None:
+            if resume.name or resume.email or resume.skills:
+                self._store_cached_resume(cache_key, resume)
+            else:
+                logger.debug(f"Not caching empty resume for file: {file_path}")
         return resume
+    
+    def parse_resumes(self, file_paths: Iterable[str], max_workers: int = 16) -> List[ResumeData]:
+        """
+        Parse multiple resume files concurrently.
+        
+        Parsing is dominated by network-bound LLM calls, so resumes are processed
+        on a thread pool. To stay within the provider's quota, configure the LLM
+        with a request limit (e.g. GeminiLLM(requests_per_minute=...)).
+        
+        Args:
+            file_paths: Paths to the resume files as strings
+            max_workers: Maximum number of resumes parsed at the same time (default: 16)
+        
+        Returns:
+            A list of ResumeData instances in the same order as file_paths
+            
+        Raises:
+            FileNotFoundError: If a file does not exist
+            ValueError: If max_workers is not positive, or a file format is invalid,
+                       unsupported, or extraction fails
+            IOError: If there's an error reading a file
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        
+        file_paths = list(file_paths)
+        logger.info(f"Starting batch parsing of {len(file_paths)} resumes with {max_workers} workers")
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths) or 1)) as executor:
+            resumes = list(executor.map(self.parse_resume, file_paths))
+        logger.info(f"Successfully parsed {len(resumes)} resumes")
+        
+        return resumes
+    
+    def _extractor_config(self) -> str:
+        """
+        Describe the extraction setup as a stable JSON string: the resume extractor
+        class and settings, and the class and settings of every field extractor.
+        """
+        extractors = getattr(self.resume_extractor, 'extractors', None)
+        fields = {}
+        if isinstance(extractors, dict):
+            fields = {
+                field_name: [_qualified_name(extractor), _settings(extractor, _FIELD_EXTRACTOR_SETTINGS)]
+                for field_name, extractor in extractors.items()
+            }
+        return json.dumps([
+            _qualified_name(self.resume_extractor),
+            _settings(self.resume_extractor, _RESUME_EXTRACTOR_SETTINGS),
+            fields
+        ], sort_keys=True)
+    
+    def _cache_key(self, data: bytes) -> str:
+        """
+        Compute the cache key for the given file content.
+        
+        The key covers the model, the prompt version and the extractor
+        configuration, so frameworks extracting differently never share entries.
+        The content is length-prefixed so the key cannot collide with a different
+        model name / prompt version / content split.
+        """
+        llm_interface = getattr(self.resume_extractor, 'llm_interface', None)
+        model_name = str(getattr(llm_interface, 'model_name', ''))
+        return hashlib.sha256(b"\x00".join([
+            model_name.encode(),
+            PROMPT_VERSION.encode(),
+            self._extractor_config().encode(),
+            len(data).to_bytes(8, 'big'),
+            data
+        ])).hexdigest()
+    
+    def _load_cached_resume(self, cache_key: str) -> Optional[ResumeData]:
+        """Load a cached ResumeData, or return None if there is no usable entry."""
+        try:
+            with open(self.cache_dir / f"{cache_key}.json", 'r', encoding='utf-8') as f:
+                return ResumeData(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable resume cache entry {cache_key}: {str(e)}")
+            return None
+    
+    def _store_cached_resume(self, cache_key: str, resume: ResumeData) -> None:
+        """Atomically write a ResumeData to the cache, logging rather than raising on failure."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(dataclasses.asdict(resume), f)
+                os.replace(tmp_path, self.cache_dir / f"{cache_key}.json")
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write resume cache entry {cache_key}: {str(e)}")
@@ -2,8 +2,10 @@
 LLM module containing LLM interface implementations.
 """
 
-from .llm_interface import LLMInterface
+from .llm_interface import BaseLLMInterface, LLMInterface
 from .gemini_llm import GeminiLLM
+from .cache import LLMCache
+from .rate_limiter import RateLimiter
 
-__all__ = ['LLMInterface', 'GeminiLLM']
+__all__ = ['LLMInterface', 'BaseLLMInterface', 'GeminiLLM', 'LLMCache', 'RateLimiter']
 
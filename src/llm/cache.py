@@ -0,0 +1,103 @@
+"""
+Persistent LLM response cache.
+Stores responses on disk keyed by a SHA-256 hash of the model, prompt version,
+prompt and generation parameters.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Bump when prompts or response handling change so stale cache entries are ignored.
+PROMPT_VERSION = "v2"
+
+
+def _describe(value: Any) -> Any:
+    """Convert generation parameters that are not JSON serializable into a stable form."""
+    if hasattr(value, 'model_json_schema'):
+        return value.model_json_schema()
+    return repr(value)
+
+
+class LLMCache:
+    """Content-addressable on-disk cache for LLM responses."""
+    
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Initialize the LLM cache.
+        
+        Args:
+            cache_dir: Directory in which cached responses are stored.
+                      Created if it does not exist.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        logger.debug(f"Initialized LLMCache in directory: {self.cache_dir}")
+    
+    @staticmethod
+    def make_key(model_name: str, prompt: str, **params) -> str:
+        """
+        Build the cache key for a request.
+        
+        Args:
+            model_name: Name of the model the request is sent to
+            prompt: The prompt sent to the model
+            **params: Generation parameters that affect the response
+        
+        Returns:
+            Hex-encoded SHA-256 digest identifying the request
+        """
+        serialized_params = json.dumps(params, sort_keys=True, default=_describe)
+        payload = "|".join((model_name, PROMPT_VERSION, serialized_params, prompt))
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key returned by make_key()
+        
+        Returns:
+            The cached response text, or None if there is no usable entry
+        """
+        try:
+            with open(self._path_for(key), 'r', encoding='utf-8') as f:
+                return json.load(f)['response']
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable LLM cache entry {key}: {str(e)}")
+            return None
+    
+    def set(self, key: str, value: str, model_name: str = "") -> None:
+        """
+        Store a response in the cache.
+        
+        The entry is written to a temporary file and atomically moved into place,
+        so concurrent readers never observe a partially written entry.
+        
+        Args:
+            key: Cache key returned by make_key()
+            value: The response text to store
+            model_name: Name of the model that produced the response
+        """
+        entry = {'response': value, 'created_at': time.time(), 'model': model_name}
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path_for(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
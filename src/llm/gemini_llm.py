@@ -3,20 +3,75 @@ Google Gemini LLM interface implementation.
 Handles interaction with Google's Gemini API.
 """
 
+import asyncio
+import functools
 import os
 import logging
-from typing import Optional
+import threading
+from typing import Dict, Optional, Tuple
 import google.genai as genai
 
-from .llm_interface import LLMInterface
+from .cache import LLMCache
+from .llm_interface import BaseLLMInterface
+from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# HTTP request timeout for the Gemini client, in milliseconds.
+_HTTP_TIMEOUT_MS = 30_000
 
-class GeminiLLM(LLMInterface):
+
+# Clients used for the async API, per event loop: a client's async transport is
+# bound to the loop it was first used on. Entries of closed loops are dropped.
+_async_clients: Dict[Tuple[asyncio.AbstractEventLoop, str, Optional[str]], 'genai.Client'] = {}
+_async_clients_lock = threading.Lock()
+
+
+def _new_client(api_key: str, base_url: Optional[str]) -> 'genai.Client':
+    """Create a Gemini client for the given API key and endpoint."""
+    http_options = {'timeout': _HTTP_TIMEOUT_MS}
+    if base_url is not None:
+        http_options['base_url'] = base_url
+    return genai.Client(api_key=api_key, http_options=http_options)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str, base_url: Optional[str] = None) -> 'genai.Client':
+    """
+    Return the shared Gemini client for the given API key and endpoint.
+    
+    Reusing one client keeps its HTTP connection pool (and therefore keep-alive
+    connections) warm across GeminiLLM instances. Only its synchronous API is
+    shared: the underlying httpx client is safe to use concurrently from
+    multiple threads, while its async transport is not (see _get_async_client).
+    """
+    return _new_client(api_key, base_url)
+
+
+def _get_async_client(api_key: str, base_url: Optional[str] = None) -> 'genai.Client':
+    """
+    Return the Gemini client for the async API on the running event loop.
+    
+    Must be called from a coroutine. Each loop gets its own client, since pooled
+    async connections cannot be reused once the loop that opened them is closed.
+    """
+    loop = asyncio.get_running_loop()
+    key = (loop, api_key, base_url)
+    with _async_clients_lock:
+        for stale_key in [stale_key for stale_key in _async_clients if stale_key[0].is_closed()]:
+            del _async_clients[stale_key]
+        client = _async_clients.get(key)
+        if client is None:
+            client = _async_clients[key] = _new_client(api_key, base_url)
+    return client
+
+
+class GeminiLLM(BaseLLMInterface):
     """Implementation of LLMInterface for Google Gemini."""
     
-    def __init__(self, model_name: str = "models/gemini-2.0-flash-lite", api_key: Optional[str] = None):
+    def __init__(self, model_name: str = "models/gemini-2.0-flash-lite", api_key: Optional[str] = None,
+                 cache: Optional[LLMCache] = None, requests_per_minute: Optional[int] = None,
+                 base_url: Optional[str] = None):
         """
         Initialize the Gemini LLM interface.
         
@@ -24,6 +79,13 @@ class GeminiLLM(LLMInterface):
             model_name: Name of the Gemini model to use (default: "models/gemini-2.0-flash-lite")
             api_key: Optional API key. If not provided, will be loaded from 
                     GEMINI_API_KEY environment variable
+            cache: Optional LLMCache. If provided, responses are looked up in and
+                  written through to the cache
+            requests_per_minute: Optional request quota. If provided, requests are
+                                throttled so that at most this many are sent per
+                                minute, across all threads sharing this instance
+            base_url: Optional Gemini API endpoint, e.g. a proxy or a local test server
+                     (default: the public Gemini API)
         
         Raises:
             ValueError: If API key is not provided and not found in environment variables
@@ -36,8 +98,11 @@ class GeminiLLM(LLMInterface):
                 "or set the GEMINI_API_KEY environment variable."
             )
         
-        self.client = genai.Client(api_key=self.api_key)
+        self.base_url = base_url
+        self.client = _get_client(self.api_key, base_url)
         self.model_name = model_name
+        self.cache = cache
+        self.rate_limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
         logger.info(f"Initialized GeminiLLM with model: {model_name}")
     
     def generate_response(self, prompt: str, **kwargs) -> str:
@@ -47,10 +112,14 @@ class GeminiLLM(LLMInterface):
         Args:
             prompt: The input prompt/question to send to Gemini
             **kwargs: Additional parameters:
-                - temperature: Controls randomness (0.0 to 1.0)
+                - temperature: Controls randomness (0.0 to 1.0, default: 0.0)
                 - max_output_tokens: Maximum number of tokens in the response
                 - top_p: Nucleus sampling parameter
                 - top_k: Top-k sampling parameter
+                - response_mime_type: Response MIME type (e.g. "application/json")
+                - response_schema: Schema (e.g. a Pydantic model) the response must match
+                - history: Earlier ``(role, text)`` turns of the conversation, sent before
+                  the prompt; role is "user" or "model"
         
         Returns:
             The generated response text from Gemini
@@ -62,31 +131,134 @@ class GeminiLLM(LLMInterface):
         """
         self.validate_prompt(prompt)
         
+        cache_key = self._cache_key(prompt, kwargs)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        
         logger.debug(f"Generating response from Gemini (model: {self.model_name}, prompt length: {len(prompt)})")
         try:
             response = self.client.models.generate_content(
                 model=self.model_name,
-                contents=prompt,
-                config={
-                    'temperature': kwargs.get('temperature', 0.7),
-                    'max_output_tokens': kwargs.get('max_output_tokens', 2048),
-                    'top_p': kwargs.get('top_p', 0.8),
-                    'top_k': kwargs.get('top_k', 40),
-                }
+                contents=self._build_contents(prompt, kwargs),
+                config=self._build_config(kwargs)
             )
             
             logger.debug(f"Received response from Gemini ({len(response.text)} characters)")
-            return response.text
+        except Exception as e:
+            raise self._translate_error(e) from e
+        
+        self._cache_set(cache_key, response.text)
+        return response.text
+    
+    async def generate_response_async(self, prompt: str, **kwargs) -> str:
+        """
+        Asynchronously generate a response from Gemini using the async client.
+        
+        Args:
+            prompt: The input prompt/question to send to Gemini
+            **kwargs: Additional parameters, as for generate_response()
+        
+        Returns:
+            The generated response text from Gemini
             
+        Raises:
+            ValueError: If the prompt is invalid
+            ConnectionError: If there's an error connecting to Gemini API
+            RuntimeError: If there's an error during Gemini processing
+        """
+        self.validate_prompt(prompt)
+        
+        cache_key = self._cache_key(prompt, kwargs)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        
+        logger.debug(f"Generating async response from Gemini (model: {self.model_name}, prompt length: {len(prompt)})")
+        try:
+            client = _get_async_client(self.api_key, self.base_url)
+            response = await client.aio.models.generate_content(
+                model=self.model_name,
+                contents=self._build_contents(prompt, kwargs),
+                config=self._build_config(kwargs)
+            )
+            
+            logger.debug(f"Received response from Gemini ({len(response.text)} characters)")
         except Exception as e:
-            error_msg = str(e).lower()
-            if 'api_key' in error_msg or 'api key' in error_msg or 'authentication' in error_msg or 'invalid' in error_msg and 'key' in error_msg:
-                logger.error(f"Authentication error with Gemini API: {str(e)}")
-                raise ConnectionError(f"Failed to authenticate with Gemini API: {str(e)}") from e
-            elif 'network' in error_msg or 'connection' in error_msg:
-                logger.error(f"Connection error with Gemini API: {str(e)}")
-                raise ConnectionError(f"Failed to connect to Gemini API: {str(e)}") from e
-            else:
-                logger.error(f"Error generating response from Gemini: {str(e)}")
-                raise RuntimeError(f"Error generating response from Gemini: {str(e)}") from e
-
+            raise self._translate_error(e) from e
+        
+        self._cache_set(cache_key, response.text)
+        return response.text
+    
+    def _cache_key(self, prompt: str, kwargs: dict) -> Optional[str]:
+        """Compute the cache key for a request, or None if caching is disabled."""
+        if self.cache is None:
+            return None
+        params = self._build_config(kwargs)
+        if kwargs.get('history'):
+            params['history'] = [list(turn) for turn in kwargs['history']]
+        return LLMCache.make_key(self.model_name, prompt, **params)
+    
+    def _cache_get(self, cache_key: Optional[str]) -> Optional[str]:
+        """Look up a cached response, if caching is enabled."""
+        if cache_key is None:
+            return None
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"LLM cache hit ({cache_key})")
+        return cached
+    
+    def _cache_set(self, cache_key: Optional[str], response_text: Optional[str]) -> None:
+        """Write a response through to the cache, if caching is enabled."""
+        if cache_key is None or response_text is None:
+            return
+        try:
+            self.cache.set(cache_key, response_text, model_name=self.model_name)
+        except OSError as e:
+            logger.warning(f"Failed to write LLM cache entry {cache_key}: {str(e)}")
+    
+    def _build_contents(self, prompt: str, kwargs: dict):
+        """Build the request contents: the prompt alone, or the conversation history followed by the prompt."""
+        history = kwargs.get('history')
+        if not history:
+            return prompt
+        turns = [{'role': role, 'parts': [{'text': text}]} for role, text in history]
+        turns.append({'role': 'user', 'parts': [{'text': prompt}]})
+        return turns
+    
+    def _build_config(self, kwargs: dict) -> dict:
+        """
+        Build the generation config from the generate_response() keyword arguments.
+        
+        Sampling defaults to greedy decoding so extraction is deterministic and
+        repeated requests can be served from the cache.
+        """
+        config = {
+            'temperature': kwargs.get('temperature', 0.0),
+            'max_output_tokens': kwargs.get('max_output_tokens', 2048),
+            'top_p': kwargs.get('top_p', 1.0),
+            'top_k': kwargs.get('top_k', 1),
+        }
+        for key in ('response_mime_type', 'response_schema'):
+            if key in kwargs:
+                config[key] = kwargs[key]
+        return config
+    
+    def _translate_error(self, e: Exception) -> Exception:
+        """Map an exception raised by the Gemini client to the LLMInterface error contract."""
+        error_msg = str(e).lower()
+        if 'api_key' in error_msg or 'api key' in error_msg or 'authentication' in error_msg or 'invalid' in error_msg and 'key' in error_msg:
+            logger.error(f"Authentication error with Gemini API: {str(e)}")
+            return ConnectionError(f"Failed to authenticate with Gemini API: {str(e)}")
+        elif 'network' in error_msg or 'connection' in error_msg:
+            logger.error(f"Connection error with Gemini API: {str(e)}")
+            return ConnectionError(f"Failed to connect to Gemini API: {str(e)}")
+        else:
+            logger.error(f"Error generating response from Gemini: {str(e)}")
+            return RuntimeError(f"Error generating response from Gemini: {str(e)}")
@@ -1,12 +1,21 @@
-"""Abstract base class for LLM interfaces."""
+"""Protocol and base class for LLM interfaces."""
 
-from abc import ABC, abstractmethod
+import asyncio
+from typing import Protocol, runtime_checkable
 
+from .._utils import validate_text
 
-class LLMInterface(ABC):
-    """Abstract base class for interacting with Large Language Models (LLMs)."""
+
+@runtime_checkable
+class LLMInterface(Protocol):
+    """
+    Protocol for interacting with Large Language Models (LLMs).
+    
+    Any object with a generate_response() method can be used as an LLM
+    interface. The optional generate_response_async() of BaseLLMInterface is
+    looked up with getattr() by its callers, so it is not part of the protocol.
+    """
     
-    @abstractmethod
     def generate_response(self, prompt: str, **kwargs) -> str:
         """
         Generate a response from the LLM based on the given prompt.
@@ -14,7 +23,10 @@ class LLMInterface(ABC):
         Args:
             prompt: The input prompt/question to send to the LLM
             **kwargs: Additional parameters specific to the LLM implementation
-                     (e.g., temperature, max_tokens, etc.)
+                     (e.g., temperature, max_tokens, etc.). Implementations that
+                     support multi-turn conversations accept a ``history`` list
+                     of ``(role, text)`` turns preceding the prompt, where role
+                     is "user" or "model".
         
         Returns:
             The generated response text from the LLM
@@ -24,27 +36,52 @@ class LLMInterface(ABC):
             ConnectionError: If there's an error connecting to the LLM service
             RuntimeError: If there's an error during LLM processing
         """
-        pass  # pragma: no cover
+        ...  # pragma: no cover
+
+
+class BaseLLMInterface(LLMInterface):
+    """
+    Base class providing default implementations of the optional LLM interface
+    methods and the prompt validation helpers.
     
-    def validate_prompt(self, prompt: str) -> None:
-        """Validate that the prompt is valid for LLM processing."""
-        if prompt is None:
-            raise ValueError("Prompt cannot be None")
+    Concrete implementations subclass this and implement generate_response().
+    """
+    
+    def generate_response(self, prompt: str, **kwargs) -> str:
+        """
+        Generate a response from the LLM based on the given prompt.
+        
+        Raises:
+            NotImplementedError: Always; subclasses must implement this method
+        """
+        raise NotImplementedError(f"{type(self).__name__} must implement generate_response()")
+    
+    async def generate_response_async(self, prompt: str, **kwargs) -> str:
+        """
+        Asynchronously generate a response from the LLM based on the given prompt.
+        
+        The default implementation runs generate_response() in a worker thread;
+        implementations with a native async client should override it.
         
-        if not isinstance(prompt, str):
-            raise ValueError(f"Prompt must be a string, got {type(prompt).__name__}")
+        Args:
+            prompt: The input prompt/question to send to the LLM
+            **kwargs: Additional parameters specific to the LLM implementation
         
-        if not prompt.strip():
-            raise ValueError("Prompt cannot be empty or whitespace only")
+        Returns:
+            The generated response text from the LLM
+            
+        Raises:
+            ValueError: If the prompt is invalid
+            ConnectionError: If there's an error connecting to the LLM service
+            RuntimeError: If there's an error during LLM processing
+        """
+        return await asyncio.to_thread(self.generate_response, prompt, **kwargs)
+    
+    def validate_prompt(self, prompt: str) -> None:
+        """Validate that the prompt is valid for LLM processing."""
+        validate_text(prompt, "Prompt")
     
     def validate_text(self, text: str) -> None:
         """Validate that the input text is valid for processing."""
-        if text is None:
-            raise ValueError("Text cannot be None")
-        
-        if not isinstance(text, str):
-            raise ValueError(f"Text must be a string, got {type(text).__name__}")
-        
-        if not text.strip():
-            raise ValueError("Text cannot be empty or whitespace only")
+        validate_text(text)
 
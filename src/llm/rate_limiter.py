@@ -0,0 +1,58 @@
+"""
+Token-bucket rate limiter for LLM API requests.
+Keeps request rates under a provider's requests-per-minute quota.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """Thread-safe token-bucket rate limiter usable from sync and async code."""
+    
+    def __init__(self, requests_per_minute: int, burst: Optional[int] = None):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            requests_per_minute: Maximum sustained number of requests per minute
+            burst: Maximum number of requests that may be issued back to back
+                  (default: requests_per_minute)
+        
+        Raises:
+            ValueError: If requests_per_minute or burst is not positive
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if burst is not None and burst <= 0:
+            raise ValueError("burst must be positive")
+        
+        self.requests_per_minute = requests_per_minute
+        self.capacity = burst or requests_per_minute
+        self._rate = requests_per_minute / 60.0
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Reserve a request slot and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self._rate)
+    
+    def acquire(self) -> None:
+        """Block until a request may be issued."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request may be issued."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -1,5 +1,7 @@
 """Abstract base class for file parsers."""
 
+import os
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
 
@@ -25,6 +27,34 @@ class FileParser(ABC):
         """
         pass  # pragma: no cover
     
+    def parse_bytes(self, data: bytes, file_path: Path) -> str:
+        """
+        Parse file content that has already been read into memory.
+        
+        The default implementation writes the content to a temporary file with
+        the same extension and parses that with parse(); parsers that can read
+        from memory should override it.
+        
+        Args:
+            data: Raw bytes of the file
+            file_path: Path the bytes were read from, used for format detection
+                      and error messages
+            
+        Returns:
+            String containing the extracted text content
+            
+        Raises:
+            ValueError: If the file format is invalid or unsupported
+            IOError: If there's an error reading the content
+        """
+        fd, tmp_path = tempfile.mkstemp(suffix=file_path.suffix)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            return self.parse(Path(tmp_path))
+        finally:
+            os.unlink(tmp_path)
+    
     @abstractmethod
     def can_parse(self, file_path: Path) -> bool:
         """
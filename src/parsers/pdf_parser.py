@@ -3,6 +3,7 @@ PDF file parser implementation.
 Handles parsing of PDF resume files.
 """
 
+import io
 import logging
 from pathlib import Path
 import pypdf
@@ -15,9 +16,7 @@ logger = logging.getLogger(__name__)
 class PDFParser(FileParser):
     """Parser for PDF files."""
     
-    def __init__(self):
-        """Initialize the PDF parser."""
-        self._supported_extensions = ['.pdf']
+    _supported_extensions = ('.pdf',)
     
     def parse(self, file_path: Path) -> str:
         """
@@ -34,25 +33,61 @@ class PDFParser(FileParser):
             ValueError: If the file format is invalid or unsupported
             IOError: If there's an error reading the file
         """
-        logger.info(f"Parsing PDF file: {file_path}")
+        logger.info("Parsing PDF file: %s", file_path)
         self.validate_file(file_path)
         
         try:
             with open(file_path, 'rb') as file:
-                pdf_reader = pypdf.PdfReader(file)
-                
-                text_content = []
-                for page in pdf_reader.pages:
-                    text_content.append(page.extract_text())
-                
-                result = '\n'.join(text_content)
-                logger.info(f"Successfully parsed PDF: {len(pdf_reader.pages)} pages, {len(result)} characters extracted")
-                return result
+                data = file.read()
+        except OSError as e:
+            logger.error("Error reading PDF file: %s - %s", file_path, e)
+            raise IOError(f"Error reading PDF file: {file_path}") from e
+        
+        return self._parse_data(data, file_path)
+    
+    def parse_bytes(self, data: bytes, file_path: Path) -> str:
+        """
+        Parse PDF content that has already been read into memory.
+        
+        Args:
+            data: Raw bytes of the PDF file
+            file_path: Path the bytes were read from, used for error messages
+            
+        Returns:
+            String containing the extracted text content from all pages
+            
+        Raises:
+            ValueError: If the content is empty or not a valid PDF
+            IOError: If there's an error reading the content
+        """
+        logger.info("Parsing PDF content: %s", file_path)
+        if not data:
+            raise ValueError(f"File is empty: {file_path}")
+        
+        return self._parse_data(data, file_path)
+    
+    def _parse_data(self, data: bytes, file_path: Path) -> str:
+        """Extract the text of every page from in-memory PDF content."""
+        try:
+            # Non-strict mode skips pypdf's extra spec checks, tolerates minor
+            # malformations and is faster on real-world resumes.
+            pdf_reader = pypdf.PdfReader(io.BytesIO(data), strict=False)
+            
+            # Write pages into a single buffer rather than keeping every page
+            # string alive until a final join.
+            buffer = io.StringIO()
+            for index, page in enumerate(pdf_reader.pages):
+                if index:
+                    buffer.write('\n')
+                buffer.write(page.extract_text() or '')
+            result = buffer.getvalue()
+            logger.info("Successfully parsed PDF: %d pages, %d characters extracted", len(pdf_reader.pages), len(result))
+            return result
         except pypdf.errors.PdfReadError as e:
-            logger.error(f"Invalid PDF file format: {file_path}")
+            logger.error("Invalid PDF file format: %s", file_path)
             raise ValueError(f"Invalid PDF file: {file_path}") from e
         except Exception as e:
-            logger.error(f"Error reading PDF file: {file_path} - {str(e)}")
+            logger.error("Error reading PDF file: %s - %s", file_path, e)
             raise IOError(f"Error reading PDF file: {file_path}") from e
     
     def can_parse(self, file_path: Path) -> bool:
@@ -74,6 +109,4 @@ class PDFParser(FileParser):
         Returns:
             List containing ['.pdf']
         """
-        return self._supported_extensions.copy()
-    
-
+        return list(self._supported_extensions)
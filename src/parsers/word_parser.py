@@ -1,23 +1,194 @@
 """
 Word document parser implementation.
 Handles parsing of Microsoft Word (.docx) resume files.
+
+The main document part is streamed out of the .docx archive with lxml's
+iterparse, so only the paragraph or table currently being read is kept
+in memory instead of python-docx's full document object graph.
 """
 
+import gc
+import hashlib
+import io
 import logging
+import os
+import threading
+import zipfile
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from docx import Document
+from typing import BinaryIO, IO, Iterable, Iterator, List, Optional, Tuple, Union
+from docx.oxml.ns import nsmap, qn
+from lxml import etree
 
 from .file_parser import FileParser
 
 logger = logging.getLogger(__name__)
 
+# Extracted text of recently parsed documents, keyed by a fingerprint of the
+# file content, so re-processing the same resume skips XML parsing entirely.
+_CACHE_MAXSIZE = 256
+_parsed_text_cache: "OrderedDict[str, str]" = OrderedDict()
+_parsed_text_cache_lock = threading.Lock()
+
+_NAMESPACES = {'w': nsmap['w']}
+_BODY_TAG = qn('w:body')
+_PARAGRAPH_TAG = qn('w:p')
+_TABLE_TAG = qn('w:tbl')
+_TEXT_TAG = qn('w:t')
+_BREAK_TAG = qn('w:br')
+_BREAK_TYPE_ATTR = qn('w:type')
+# Text of the other run children python-docx renders; anything else in a run
+# (properties, drawings, text boxes) adds no text.
+_RUN_CHILD_TEXT = {
+    qn('w:tab'): '\t',
+    qn('w:ptab'): '\t',
+    qn('w:cr'): '\n',
+    qn('w:noBreakHyphen'): '-',
+}
+
+# Compiled once at import instead of on every xpath() call. Only the paragraph's
+# own runs are read, not runs nested in text boxes or alternate content.
+_RUN_CONTENT_XPATH = etree.XPath('./w:r/* | ./w:hyperlink/w:r/*', namespaces=_NAMESPACES)
+_ROWS_XPATH = etree.XPath('./w:tr', namespaces=_NAMESPACES)
+_CELLS_XPATH = etree.XPath('./w:tc', namespaces=_NAMESPACES)
+_CHILD_PARAGRAPHS_XPATH = etree.XPath('./w:p', namespaces=_NAMESPACES)
+
+_ZIP_MAGIC = b'PK\x03\x04'
+_DEFAULT_DOCUMENT_PART = 'word/document.xml'
+_PACKAGE_RELATIONSHIPS_PART = '_rels/.rels'
+_OFFICE_DOCUMENT_RELATIONSHIP = '/officeDocument'
+
+
+def _main_document_part(archive: zipfile.ZipFile) -> str:
+    """Return the archive name of the main document part, as declared in the package relationships."""
+    try:
+        relationships = etree.fromstring(
+            archive.read(_PACKAGE_RELATIONSHIPS_PART), etree.XMLParser(resolve_entities=False)
+        )
+    except KeyError:
+        return _DEFAULT_DOCUMENT_PART
+    for relationship in relationships:
+        if relationship.get('Type', '').endswith(_OFFICE_DOCUMENT_RELATIONSHIP) and relationship.get('Target'):
+            return relationship.get('Target').lstrip('/')
+    return _DEFAULT_DOCUMENT_PART
+
+
+def _iter_body_elements(document_xml: IO[bytes]) -> Iterator[etree._Element]:
+    """
+    Stream the top-level paragraphs and tables of a document part, in document order.
+    
+    Each element is cleared and detached from the tree once the caller moves on,
+    so memory stays proportional to the current paragraph or table.
+    """
+    for _, element in etree.iterparse(document_xml, events=('end',), tag=(_PARAGRAPH_TAG, _TABLE_TAG),
+                                      resolve_entities=False):
+        parent = element.getparent()
+        if parent is None or parent.tag != _BODY_TAG:
+            # Paragraphs nested in tables are read with their table.
+            continue
+        yield element
+        element.clear()
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+def _paragraph_text(paragraph) -> str:
+    """
+    Concatenate the run text of a <w:p> element, matching python-docx's Paragraph.text.
+    
+    Tabs become "\t", line breaks "\n" and non-breaking hyphens "-"; page and
+    column breaks add no text.
+    """
+    parts = []
+    for node in _RUN_CONTENT_XPATH(paragraph):
+        if node.tag == _TEXT_TAG:
+            parts.append(node.text or '')
+        elif node.tag == _BREAK_TAG:
+            if node.get(_BREAK_TYPE_ATTR) in (None, 'textWrapping'):
+                parts.append('\n')
+        else:
+            parts.append(_RUN_CHILD_TEXT.get(node.tag, ''))
+    return ''.join(parts)
+
+
+def _row_text(row) -> str:
+    """Join the non-empty, stripped cell texts of a <w:tr> element with ' | '."""
+    row_text = []
+    for cell in _CELLS_XPATH(row):
+        cell_text = '\n'.join(
+            _paragraph_text(paragraph) for paragraph in _CHILD_PARAGRAPHS_XPATH(cell)
+        ).strip()
+        if cell_text:
+            row_text.append(cell_text)
+    return ' | '.join(row_text)
+
+
+def _iter_lines(document_xml: IO[bytes], counts: Counter) -> Iterator[str]:
+    """
+    Yield the output lines of a document part: non-empty paragraphs, then, after
+    a blank line, one line per non-empty table row.
+    
+    Paragraph lines are produced while the part is streamed; table rows are held
+    back until the end so tables still follow the paragraph text. The number of
+    paragraphs and table rows is recorded in counts.
+    """
+    table_rows = []
+    for element in _iter_body_elements(document_xml):
+        if element.tag == _PARAGRAPH_TAG:
+            paragraph_text = _paragraph_text(element)
+            # isspace() tests for blank text without building a stripped copy.
+            if paragraph_text and not paragraph_text.isspace():
+                counts['paragraphs'] += 1
+                yield paragraph_text
+            continue
+        
+        for row in _ROWS_XPATH(element):
+            row_text = _row_text(row)
+            if row_text:
+                table_rows.append(row_text)
+    
+    counts['table_rows'] = len(table_rows)
+    if table_rows:
+        # The leading paragraph lines, if any, are followed by one blank line.
+        if counts['paragraphs']:
+            yield ''
+        yield from table_rows
+
+
+def _iter_document_lines(source: Union[Path, BinaryIO], file_path: Path, counts: Counter) -> Iterator[str]:
+    """Stream the output lines of a .docx archive, reporting read errors as IOError."""
+    try:
+        with zipfile.ZipFile(source) as archive, archive.open(_main_document_part(archive)) as document_xml:
+            yield from _iter_lines(document_xml, counts)
+    except (FileNotFoundError, ValueError):
+        raise
+    except Exception as e:
+        logger.error("Error reading Word document: %s - %s", file_path, e)
+        raise IOError(f"Error reading Word document: {file_path}") from e
+
+
+def _parse_one(path: str) -> str:
+    """
+    Parse a single Word document in a parse_many() worker process.
+    
+    This is a module-level function so process pools can pickle it. Workers
+    run a full cycle collection after each document, so long batch runs return
+    the memory of parsed XML trees and exception tracebacks promptly instead of
+    growing until the collector's thresholds are reached. Single-shot parse()
+    calls do not pay for the collection.
+    """
+    try:
+        return WordParser().parse(Path(path))
+    finally:
+        gc.collect()
+
 
 class WordParser(FileParser):
     """Parser for Microsoft Word (.docx) files."""
     
-    def __init__(self):
-        """Initialize the Word parser."""
-        self._supported_extensions = ['.docx']
+    # WordParser instances hold no state, so they can be shared freely.
+    _supported_extensions = ('.docx',)
     
     def parse(self, file_path: Path) -> str:
         """
@@ -34,38 +205,124 @@ class WordParser(FileParser):
             ValueError: If the file format is invalid or unsupported
             IOError: If there's an error reading the file
         """
-        logger.info(f"Parsing Word document: {file_path}")
-        self.validate_file(file_path)
+        logger.info("Parsing Word document: %s", file_path)
         
+        # Open the file once and validate its content, rather than checking the
+        # path with separate stat calls before reading it.
         try:
-            doc = Document(file_path)
+            with open(file_path, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {file_path}") from e
+        except IsADirectoryError as e:
+            raise ValueError(f"Path is not a file: {file_path}") from e
+        except OSError as e:
+            logger.error("Error reading Word document: %s - %s", file_path, e)
+            raise IOError(f"Error reading Word document: {file_path}") from e
+        
+        self._validate_bytes(data, file_path)
+        return self._parse_data(data, file_path)
+    
+    def parse_bytes(self, data: bytes, file_path: Path) -> str:
+        """
+        Parse Word document content that has already been read into memory.
+        
+        Args:
+            data: Raw bytes of the Word document
+            file_path: Path the bytes were read from, used for error messages
             
-            text_content = []
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text_content.append(paragraph.text)
+        Returns:
+            String containing the extracted text content from paragraphs and tables
             
-            table_text = []
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = []
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            row_text.append(cell.text.strip())
-                    if row_text:
-                        table_text.append(' | '.join(row_text))
+        Raises:
+            ValueError: If the content is empty or not a .docx archive
+            IOError: If there's an error reading the content
+        """
+        logger.info("Parsing Word document content: %s", file_path)
+        self._validate_bytes(data, file_path)
+        
+        return self._parse_data(data, file_path)
+    
+    def _validate_bytes(self, data: bytes, file_path: Path) -> None:
+        """Validate that in-memory content is non-empty and starts like a .docx (zip) archive."""
+        if not data:
+            raise ValueError(f"File is empty: {file_path}")
+        
+        if not data.startswith(_ZIP_MAGIC):
+            raise ValueError(f"Invalid Word document: {file_path}")
+    
+    def parse_many(self, file_paths: Iterable[Path], max_workers: Optional[int] = None) -> Iterator[Tuple[Path, str]]:
+        """
+        Parse many Word documents in parallel worker processes.
+        
+        XML parsing is CPU-bound, so documents are spread across processes
+        rather than threads to sidestep the GIL. Results are yielded lazily in
+        the order of file_paths.
+        
+        Args:
+            file_paths: Paths to the Word documents to be parsed
+            max_workers: Number of worker processes (default: os.cpu_count())
             
-            all_text = '\n'.join(text_content)
-            if table_text:
-                all_text += '\n\n' + '\n'.join(table_text)
+        Returns:
+            An iterator of (file_path, text) tuples
             
-            logger.info(f"Successfully parsed Word document: {len(text_content)} paragraphs, {len(table_text)} table rows, {len(all_text)} characters extracted")
-            return all_text
-        except Exception as e:
-            if isinstance(e, (FileNotFoundError, ValueError)):
-                raise
-            logger.error(f"Error reading Word document: {file_path} - {str(e)}")
-            raise IOError(f"Error reading Word document: {file_path}") from e
+        Raises:
+            FileNotFoundError: If a file does not exist
+            ValueError: If max_workers is not positive, or a file format is invalid
+            IOError: If there's an error reading a file
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        
+        # Arguments are validated here, on the call, while the parsing itself
+        # runs lazily in the generator.
+        return self._parse_many([Path(file_path) for file_path in file_paths], max_workers)
+    
+    def _parse_many(self, file_paths: List[Path], max_workers: Optional[int]) -> Iterator[Tuple[Path, str]]:
+        """Yield the (file_path, text) tuples of parse_many() from a pool of worker processes."""
+        if not file_paths:
+            return
+        
+        logger.info("Parsing %d Word documents in worker processes", len(file_paths))
+        workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            texts = executor.map(_parse_one, (str(file_path) for file_path in file_paths), chunksize=4)
+            yield from zip(file_paths, texts)
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Discard all cached document text."""
+        with _parsed_text_cache_lock:
+            _parsed_text_cache.clear()
+    
+    def _parse_data(self, data: bytes, file_path: Path) -> str:
+        """Return the text of in-memory Word content, parsing it only on a cache miss."""
+        fingerprint = hashlib.blake2b(data, digest_size=16).hexdigest()
+        with _parsed_text_cache_lock:
+            cached = _parsed_text_cache.get(fingerprint)
+            if cached is not None:
+                _parsed_text_cache.move_to_end(fingerprint)
+        if cached is not None:
+            logger.debug("Word document cache hit: %s", file_path)
+            return cached
+        
+        text = self._parse_document(io.BytesIO(data), file_path)
+        with _parsed_text_cache_lock:
+            _parsed_text_cache[fingerprint] = text
+            if len(_parsed_text_cache) > _CACHE_MAXSIZE:
+                _parsed_text_cache.popitem(last=False)
+        return text
+    
+    def _parse_document(self, source: BinaryIO, file_path: Path) -> str:
+        """Extract paragraph and table text from a .docx archive binary stream."""
+        counts = Counter()
+        all_text = '\n'.join(_iter_document_lines(source, file_path, counts))
+        
+        logger.info(
+            "Successfully parsed Word document: %d paragraphs, %d table rows, %d characters extracted",
+            counts['paragraphs'], counts['table_rows'], len(all_text)
+        )
+        return all_text
     
     def can_parse(self, file_path: Path) -> bool:
         """
@@ -86,6 +343,4 @@ class WordParser(FileParser):
         Returns:
             List containing ['.docx']
         """
-        return self._supported_extensions.copy()
-    
-
+        return list(self._supported_extensions)
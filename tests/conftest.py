@@ -0,0 +1,93 @@
+"""Shared pytest fixtures."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.extractors.email_extractor import EmailExtractor
+from src.extractors.name_extractor import NameExtractor
+from src.extractors.skills_extractor import SkillsExtractor
+from src.parsers.word_parser import WordParser
+
+# Plain-text resume shared by the extractor and framework tests.
+SAMPLE_RESUME_TEXT = (
+    "John Doe\njohn.doe@example.com\n\n"
+    "Experience\nSoftware Engineer at Example Corp, 2019-2024\n\n"
+    "Skills\nPython, Java, SQL"
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_word_parser_cache():
+    """Start every test with an empty WordParser text cache."""
+    WordParser.clear_cache()
+    yield
+    WordParser.clear_cache()
+
+
+@pytest.fixture(scope="module")
+def name_extractor():
+    """A NameExtractor shared by the tests of a module; field extractors hold no state."""
+    return NameExtractor()
+
+
+@pytest.fixture(scope="module")
+def email_extractor():
+    """An EmailExtractor shared by the tests of a module."""
+    return EmailExtractor()
+
+
+@pytest.fixture(scope="module")
+def skills_extractor():
+    """A SkillsExtractor shared by the tests of a module."""
+    return SkillsExtractor()
+
+
+@pytest.fixture
+def field_extractors(name_extractor, email_extractor, skills_extractor):
+    """A fresh extractors dictionary, which tests may extend, built from the shared extractors."""
+    return {
+        'name': name_extractor,
+        'email': email_extractor,
+        'skills': skills_extractor
+    }
+
+
+class _FakeGeminiHandler(BaseHTTPRequestHandler):
+    """Answer generateContent requests like the Gemini API, with canned field values."""
+    
+    # Keep-alive, so clients reuse pooled connections as they do against the real API.
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        prompt = body['contents'][-1]['parts'][0]['text']
+        text = "Python,Java" if "Extract the skills" in prompt else "John Doe"
+        payload = json.dumps({
+            'candidates': [{'content': {'role': 'model', 'parts': [{'text': text}]}, 'finishReason': 'STOP'}]
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def fake_gemini_url():
+    """
+    URL of a local HTTP server standing in for the Gemini API, for tests that
+    drive a real genai.Client. Skills prompts are answered with "Python,Java",
+    every other prompt with "John Doe".
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeGeminiHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
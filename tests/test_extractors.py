@@ -1,171 +1,276 @@
 """Tests for field extractors."""
 
+import asyncio
+import json
+import threading
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from typing import List
 
 from src.extractors.name_extractor import NameExtractor
 from src.extractors.email_extractor import EmailExtractor
 from src.extractors.skills_extractor import SkillsExtractor
 from src.extractors.resume_extractor import ResumeExtractor
-from src.extractors.field_extractor import FieldExtractor
+from src.extractors.batched_resume_extractor import BatchedResumeExtractor
+from src.extractors.bulk_resume_extractor import BulkResumeExtractor
+from src.extractors.field_extractor import BaseFieldExtractor, FieldExtractor
+from src.llm.gemini_llm import GeminiLLM
 from src.models.resume import ResumeData
 
+from .conftest import SAMPLE_RESUME_TEXT
+
 
 class TestNameExtractor:
     """Test cases for NameExtractor."""
     
-    def test_init(self):
+    def test_init(self, name_extractor):
         """Test NameExtractor initialization."""
-        extractor = NameExtractor()
-        assert isinstance(extractor, FieldExtractor)
+        assert isinstance(name_extractor, FieldExtractor)
     
-    def test_validate_text_none(self):
+    def test_validate_text_none(self, name_extractor):
         """Test validate_text raises ValueError for None."""
-        extractor = NameExtractor()
-        
         with pytest.raises(ValueError, match="Text cannot be None"):
-            extractor.validate_text(None)
+            name_extractor.validate_text(None)
     
-    def test_validate_text_not_string(self):
+    def test_validate_text_not_string(self, name_extractor):
         """Test validate_text raises ValueError for non-string."""
-        extractor = NameExtractor()
-        
         with pytest.raises(ValueError, match="Text must be a string"):
-            extractor.validate_text(123)
+            name_extractor.validate_text(123)
         
         # Test with different non-string types to ensure full coverage
         with pytest.raises(ValueError, match="Text must be a string"):
-            extractor.validate_text([])
+            name_extractor.validate_text([])
         with pytest.raises(ValueError, match="Text must be a string"):
-            extractor.validate_text({})
+            name_extractor.validate_text({})
     
-    def test_validate_text_empty(self):
+    def test_validate_text_empty(self, name_extractor):
         """Test validate_text raises ValueError for empty string."""
-        extractor = NameExtractor()
-        
         with pytest.raises(ValueError, match="Text cannot be empty"):
-            extractor.validate_text("")
+            name_extractor.validate_text("")
         with pytest.raises(ValueError, match="Text cannot be empty"):
-            extractor.validate_text("   ")
+            name_extractor.validate_text("   ")
     
-    def test_extract_success(self):
+    def test_extract_success(self, name_extractor):
         """Test successful name extraction."""
-        extractor = NameExtractor()
         mock_llm = Mock()
         mock_llm.generate_response.return_value = "John Doe"
         
-        result = extractor.extract("Resume text here", mock_llm)
+        result = name_extractor.extract("Resume text here", mock_llm)
         
         assert result == "John Doe"
         mock_llm.generate_response.assert_called_once()
+        assert mock_llm.generate_response.call_args.kwargs == {'max_output_tokens': 32}
     
-    def test_extract_returns_none_when_empty_response(self):
+    def test_extract_returns_none_when_empty_response(self, name_extractor):
         """Test extract returns None when LLM returns empty response."""
-        extractor = NameExtractor()
         mock_llm = Mock()
         mock_llm.generate_response.return_value = ""
         
-        result = extractor.extract("Resume text here", mock_llm)
+        result = name_extractor.extract("Resume text here", mock_llm)
         
         assert result is None
+    
+    def test_extract_truncates_context(self, name_extractor):
+        """Test only the start of a long resume is sent to the LLM."""
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = "John Doe"
+        text = "John Doe\n" + "x" * 5000
+        
+        name_extractor.extract(text, mock_llm)
+        
+        prompt = mock_llm.generate_response.call_args[0][0]
+        assert text[:name_extractor.max_context_chars] in prompt
+        assert text[:name_extractor.max_context_chars + 1] not in prompt
+    
+    def test_extract_async(self, name_extractor):
+        """Test extract_async returns the same result as extract."""
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = "John Doe"
+        
+        result = asyncio.run(name_extractor.extract_async("Resume text here", mock_llm))
+        
+        assert result == "John Doe"
+        mock_llm.generate_response.assert_called_once()
+    
+    def test_extract_async_uses_async_llm(self, name_extractor):
+        """Test extract_async awaits the LLM's generate_response_async instead of blocking a thread."""
+        mock_llm = Mock()
+        mock_llm.generate_response_async = AsyncMock(return_value="John Doe")
+        
+        result = asyncio.run(name_extractor.extract_async("Resume text here", mock_llm))
+        
+        assert result == "John Doe"
+        mock_llm.generate_response_async.assert_awaited_once_with(
+            name_extractor.build_prompt("Resume text here"), max_output_tokens=32
+        )
+        mock_llm.generate_response.assert_not_called()
+    
+    def test_extract_prompt_starts_with_resume_text(self, name_extractor):
+        """Test the resume text comes first so it forms a prefix shared by all field prompts."""
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = ""
+        
+        name_extractor.extract("Resume text here", mock_llm)
+        
+        prompt = mock_llm.generate_response.call_args[0][0]
+        assert prompt.startswith("Resume text:\nResume text here\n\nTask:")
+        assert "/n" not in prompt
 
 
 class TestEmailExtractor:
     """Test cases for EmailExtractor."""
     
-    def test_init(self):
+    def test_init(self, email_extractor):
         """Test EmailExtractor initialization."""
-        extractor = EmailExtractor()
-        assert isinstance(extractor, FieldExtractor)
+        assert isinstance(email_extractor, FieldExtractor)
     
-    def test_extract_success(self):
+    def test_extract_success(self, email_extractor):
         """Test successful email extraction."""
-        extractor = EmailExtractor()
         mock_llm = Mock()
         mock_llm.generate_response.return_value = "john.doe@example.com"
         
-        result = extractor.extract("Resume text here", mock_llm)
+        result = email_extractor.extract("Resume text here", mock_llm)
         
         assert result == "john.doe@example.com"
         mock_llm.generate_response.assert_called_once()
     
-    def test_extract_returns_none_when_empty_response(self):
+    def test_extract_with_regex_skips_llm(self, email_extractor):
+        """Test an email found by the regex is returned without calling the LLM."""
+        mock_llm = Mock()
+        
+        result = email_extractor.extract("John Doe\nContact: john.doe+jobs@example.co.uk | 555-0100", mock_llm)
+        
+        assert result == "john.doe+jobs@example.co.uk"
+        mock_llm.generate_response.assert_not_called()
+    
+    def test_extract_returns_none_when_empty_response(self, email_extractor):
         """Test extract returns None when LLM returns empty response."""
-        extractor = EmailExtractor()
         mock_llm = Mock()
         mock_llm.generate_response.return_value = ""
         
-        result = extractor.extract("Resume text here", mock_llm)
+        result = email_extractor.extract("Resume text here", mock_llm)
         
         assert result is None
+    
+    def test_extract_prompt_starts_with_resume_text(self, email_extractor):
+        """Test the resume text comes first so it forms a prefix shared by all field prompts."""
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = ""
+        
+        email_extractor.extract("Resume text here", mock_llm)
+        
+        prompt = mock_llm.generate_response.call_args[0][0]
+        assert prompt.startswith("Resume text:\nResume text here\n\nTask:")
+        assert "/n" not in prompt
 
 
 class TestSkillsExtractor:
     """Test cases for SkillsExtractor."""
     
-    def test_init(self):
+    def test_init(self, skills_extractor):
         """Test SkillsExtractor initialization."""
-        extractor = SkillsExtractor()
-        assert isinstance(extractor, FieldExtractor)
+        assert isinstance(skills_extractor, FieldExtractor)
     
-    def test_extract_success(self):
+    def test_extract_success(self, skills_extractor):
         """Test successful skills extraction."""
-        extractor = SkillsExtractor()
         mock_llm = Mock()
         mock_llm.generate_response.return_value = "Python,Java,SQL"
         
-        result = extractor.extract("Resume text here", mock_llm)
+        result = skills_extractor.extract("Resume text here", mock_llm)
         
         assert result == ["Python", "Java", "SQL"]
         mock_llm.generate_response.assert_called_once()
+        assert mock_llm.generate_response.call_args.kwargs == {'max_output_tokens': 512}
     
-    def test_extract_with_spaces(self):
+    def test_extract_with_spaces(self, skills_extractor):
         """Test skills extraction handles spaces correctly."""
-        extractor = SkillsExtractor()
         mock_llm = Mock()
         mock_llm.generate_response.return_value = "Python, Java, SQL"
         
-        result = extractor.extract("Resume text here", mock_llm)
+        result = skills_extractor.extract("Resume text here", mock_llm)
+        
+        assert result == ["Python", "Java", "SQL"]
+    
+    def test_select_context_short_text(self, skills_extractor):
+        """Test short texts are used in full."""
+        assert skills_extractor.select_context("Skills: Python") == "Skills: Python"
+    
+    def test_select_context_locates_skills_section(self, skills_extractor):
+        """Test the skills section of a long resume is kept along with its start."""
+        head = "John Doe\n" + "a" * 3000
+        section = "\nSKILLS\nPython, Java\n"
+        text = head + section + "b" * 10000
+        
+        context = skills_extractor.select_context(text)
+        
+        assert context.startswith(text[:skills_extractor.head_chars])
+        assert "SKILLS\nPython, Java" in context
+        assert len(context) < skills_extractor.max_context_chars
+    
+    def test_select_context_without_skills_section(self, skills_extractor):
+        """Test long resumes without a skills heading are truncated."""
+        text = "a" * 10000
+        
+        assert skills_extractor.select_context(text) == text[:skills_extractor.max_context_chars]
+    
+    def test_extract_removes_duplicates_and_empty_entries(self, skills_extractor):
+        """Test duplicate and empty skills are dropped, preserving order."""
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = "Python, Java,,Python;SQL\nJava\n"
+        
+        result = skills_extractor.extract("Resume text here", mock_llm)
         
         assert result == ["Python", "Java", "SQL"]
     
-    def test_extract_returns_none_when_empty_response(self):
+    def test_extract_returns_none_when_only_separators(self, skills_extractor):
+        """Test extract returns None when the response contains no skills."""
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = " , ,\n"
+        
+        result = skills_extractor.extract("Resume text here", mock_llm)
+        
+        assert result is None
+    
+    def test_extract_returns_none_when_empty_response(self, skills_extractor):
         """Test extract returns None when LLM returns empty response."""
-        extractor = SkillsExtractor()
         mock_llm = Mock()
         mock_llm.generate_response.return_value = ""
         
-        result = extractor.extract("Resume text here", mock_llm)
+        result = skills_extractor.extract("Resume text here", mock_llm)
         
         assert result is None
     
-    def test_extract_single_skill(self):
+    def test_extract_single_skill(self, skills_extractor):
         """Test skills extraction with single skill."""
-        extractor = SkillsExtractor()
         mock_llm = Mock()
         mock_llm.generate_response.return_value = "Python"
         
-        result = extractor.extract("Resume text here", mock_llm)
+        result = skills_extractor.extract("Resume text here", mock_llm)
         
         assert result == ["Python"]
+    
+    def test_extract_prompt_starts_with_resume_text(self, skills_extractor):
+        """Test the resume text comes first so it forms a prefix shared by all field prompts."""
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = ""
+        
+        skills_extractor.extract("Resume text here", mock_llm)
+        
+        prompt = mock_llm.generate_response.call_args[0][0]
+        assert prompt.startswith("Resume text:\nResume text here\n\nTask:")
+        assert "/n" not in prompt
 
 
 class TestResumeExtractor:
     """Test cases for ResumeExtractor."""
     
-    def test_init_success(self):
+    def test_init_success(self, field_extractors):
         """Test ResumeExtractor initialization with valid extractors."""
         mock_llm = Mock()
-        extractors = {
-            'name': NameExtractor(),
-            'email': EmailExtractor(),
-            'skills': SkillsExtractor()
-        }
-        
-        resume_extractor = ResumeExtractor(extractors, mock_llm)
+        resume_extractor = ResumeExtractor(field_extractors, mock_llm)
         
-        assert resume_extractor.extractors == extractors
+        assert resume_extractor.extractors == field_extractors
         assert resume_extractor.llm_interface == mock_llm
     
     def test_init_empty_extractors(self):
@@ -195,16 +300,16 @@ class TestResumeExtractor:
         }
         
         resume_extractor = ResumeExtractor(extractors, mock_llm)
-        result = resume_extractor.extract("Resume text here")
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
         
         assert isinstance(result, ResumeData)
         assert result.name == "John Doe"
         assert result.email == "john.doe@example.com"
         assert result.skills == ["Python", "Java"]
         
-        mock_name_extractor.extract.assert_called_once_with("Resume text here", mock_llm)
-        mock_email_extractor.extract.assert_called_once_with("Resume text here", mock_llm)
-        mock_skills_extractor.extract.assert_called_once_with("Resume text here", mock_llm)
+        mock_name_extractor.extract.assert_called_once_with(SAMPLE_RESUME_TEXT, mock_llm)
+        mock_email_extractor.extract.assert_called_once_with(SAMPLE_RESUME_TEXT, mock_llm)
+        mock_skills_extractor.extract.assert_called_once_with(SAMPLE_RESUME_TEXT, mock_llm)
     
     def test_extract_with_missing_fields(self):
         """Test extract handles missing fields with defaults."""
@@ -226,7 +331,7 @@ class TestResumeExtractor:
         }
         
         resume_extractor = ResumeExtractor(extractors, mock_llm)
-        result = resume_extractor.extract("Resume text here")
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
         
         assert result.name == "John Doe"
         assert result.email == "john.doe@example.com"
@@ -252,7 +357,7 @@ class TestResumeExtractor:
         }
         
         resume_extractor = ResumeExtractor(extractors, mock_llm)
-        result = resume_extractor.extract("Resume text here")
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
         
         assert result.name == ""
         assert result.email == "john.doe@example.com"
@@ -278,50 +383,32 @@ class TestResumeExtractor:
         }
         
         resume_extractor = ResumeExtractor(extractors, mock_llm)
-        result = resume_extractor.extract("Resume text here")
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
         
         assert result.name == "John Doe"
         assert result.email == ""
         assert result.skills == ["Python"]
     
-    def test_extract_empty_text(self):
+    def test_extract_empty_text(self, field_extractors):
         """Test extract raises ValueError for empty text."""
         mock_llm = Mock()
-        extractors = {
-            'name': NameExtractor(),
-            'email': EmailExtractor(),
-            'skills': SkillsExtractor()
-        }
-        
-        resume_extractor = ResumeExtractor(extractors, mock_llm)
+        resume_extractor = ResumeExtractor(field_extractors, mock_llm)
         
         with pytest.raises(ValueError, match="Text cannot be empty"):
             resume_extractor.extract("")
     
-    def test_extract_none_text(self):
+    def test_extract_none_text(self, field_extractors):
         """Test extract raises ValueError for None text."""
         mock_llm = Mock()
-        extractors = {
-            'name': NameExtractor(),
-            'email': EmailExtractor(),
-            'skills': SkillsExtractor()
-        }
-        
-        resume_extractor = ResumeExtractor(extractors, mock_llm)
+        resume_extractor = ResumeExtractor(field_extractors, mock_llm)
         
         with pytest.raises(ValueError, match="Text cannot be empty"):
             resume_extractor.extract(None)
     
-    def test_extract_whitespace_only_text(self):
+    def test_extract_whitespace_only_text(self, field_extractors):
         """Test extract raises ValueError for whitespace-only text."""
         mock_llm = Mock()
-        extractors = {
-            'name': NameExtractor(),
-            'email': EmailExtractor(),
-            'skills': SkillsExtractor()
-        }
-        
-        resume_extractor = ResumeExtractor(extractors, mock_llm)
+        resume_extractor = ResumeExtractor(field_extractors, mock_llm)
         
         with pytest.raises(ValueError, match="Text cannot be empty"):
             resume_extractor.extract("   ")
@@ -350,10 +437,449 @@ class TestResumeExtractor:
         }
         
         resume_extractor = ResumeExtractor(extractors, mock_llm)
-        result = resume_extractor.extract("Resume text here")
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
         
         # Should still create ResumeData with default values for phone
         assert result.name == "John Doe"
         assert result.email == "john.doe@example.com"
         assert result.skills == ["Python"]
+    
+    def test_extract_runs_extractors_concurrently(self):
+        """Test field extractors are run concurrently rather than one after another."""
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def wait_for_all(value):
+            def extract(text, llm_interface):
+                barrier.wait()
+                return value
+            return extract
+        
+        extractors = {
+            'name': Mock(extract=Mock(side_effect=wait_for_all("John Doe"))),
+            'email': Mock(extract=Mock(side_effect=wait_for_all("john.doe@example.com"))),
+            'skills': Mock(extract=Mock(side_effect=wait_for_all(["Python"])))
+        }
+        
+        resume_extractor = ResumeExtractor(extractors, Mock())
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
+        
+        assert result == ResumeData(name="John Doe", email="john.doe@example.com", skills=["Python"])
+    
+    def test_extract_propagates_extractor_errors(self):
+        """Test an error raised by a field extractor is propagated."""
+        mock_name_extractor = Mock()
+        mock_name_extractor.extract.return_value = "John Doe"
+        mock_email_extractor = Mock()
+        mock_email_extractor.extract.side_effect = RuntimeError("LLM failure")
+        
+        extractors = {
+            'name': mock_name_extractor,
+            'email': mock_email_extractor
+        }
+        
+        resume_extractor = ResumeExtractor(extractors, Mock())
+        
+        with pytest.raises(RuntimeError, match="LLM failure"):
+            resume_extractor.extract(SAMPLE_RESUME_TEXT)
+    
+    @pytest.mark.parametrize("text, require_resume_keywords", [
+        ("   \n\x0c\n  1  \n", False),
+        ("Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor.", True),
+    ])
+    def test_extract_skips_llm_for_degenerate_text(self, text, require_resume_keywords):
+        """Test near-empty or non-resume text returns empty data without calling extractors."""
+        mock_extractor = Mock()
+        resume_extractor = ResumeExtractor(
+            {'name': mock_extractor}, Mock(), require_resume_keywords=require_resume_keywords
+        )
+        
+        result = resume_extractor.extract(text)
+        
+        assert result == ResumeData(name="", email="", skills=[])
+        mock_extractor.extract.assert_not_called()
+    
+    def test_extract_without_resume_keywords_by_default(self):
+        """Test text without resume headings is sent to the LLM unless require_resume_keywords is set."""
+        mock_extractor = Mock()
+        mock_extractor.extract.return_value = "John Doe"
+        resume_extractor = ResumeExtractor({'name': mock_extractor}, Mock())
+        
+        result = resume_extractor.extract("John Doe\njohn.doe@example.com\nPython developer with ten years in fintech.")
+        
+        assert result.name == "John Doe"
+        mock_extractor.extract.assert_called_once()
+    
+    def test_extract_degenerate_check_configurable(self):
+        """Test the degenerate-text short-circuit can be disabled."""
+        mock_extractor = Mock()
+        mock_extractor.extract.return_value = "John Doe"
+        resume_extractor = ResumeExtractor(
+            {'name': mock_extractor}, Mock(), min_text_chars=0, require_resume_keywords=False
+        )
+        
+        result = resume_extractor.extract("John Doe")
+        
+        assert result.name == "John Doe"
+    
+    def test_extract_async(self):
+        """Test extract_async can be awaited from a running event loop."""
+        mock_name_extractor = Mock()
+        mock_name_extractor.extract.return_value = "John Doe"
+        
+        resume_extractor = ResumeExtractor({'name': mock_name_extractor}, Mock())
+        result = asyncio.run(resume_extractor.extract_async(SAMPLE_RESUME_TEXT))
+        
+        assert result.name == "John Doe"
+    
+    def test_extract_async_awaits_field_extractors_async(self, field_extractors):
+        """Test extract_async runs real field extractors through their extract_async and the LLM's async path."""
+        mock_llm = Mock()
+        mock_llm.generate_response_async = AsyncMock(side_effect=["John Doe", "Python,Java"])
+        
+        resume_extractor = ResumeExtractor(field_extractors, mock_llm)
+        result = asyncio.run(resume_extractor.extract_async(SAMPLE_RESUME_TEXT))
+        
+        assert result == ResumeData(name="John Doe", email="john.doe@example.com", skills=["Python", "Java"])
+        assert mock_llm.generate_response_async.await_count == 2
+        mock_llm.generate_response.assert_not_called()
+    
+    def test_extract_uses_sync_llm_path(self, field_extractors):
+        """Test the synchronous extract never goes through the LLM's async path."""
+        mock_llm = Mock()
+        mock_llm.generate_response_async = AsyncMock()
+        mock_llm.generate_response.side_effect = lambda prompt, **kwargs: "Python,Java" if "Extract the skills" in prompt else "John Doe"
+        
+        resume_extractor = ResumeExtractor(field_extractors, mock_llm)
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
+        
+        assert result == ResumeData(name="John Doe", email="john.doe@example.com", skills=["Python", "Java"])
+        mock_llm.generate_response_async.assert_not_awaited()
+    
+    def test_extract_repeatedly_with_gemini(self, field_extractors, fake_gemini_url):
+        """Test consecutive extract calls through a real Gemini client all succeed."""
+        llm = GeminiLLM(api_key="test-key", base_url=fake_gemini_url)
+        resume_extractor = ResumeExtractor(field_extractors, llm)
+        
+        results = [resume_extractor.extract(SAMPLE_RESUME_TEXT) for _ in range(3)]
+        
+        assert results == [ResumeData(name="John Doe", email="john.doe@example.com", skills=["Python", "Java"])] * 3
+    
+    def test_extract_async_repeatedly_with_gemini(self, field_extractors, fake_gemini_url):
+        """Test extract_async through a real Gemini client succeeds on consecutive event loops."""
+        llm = GeminiLLM(api_key="test-key", base_url=fake_gemini_url)
+        resume_extractor = ResumeExtractor(field_extractors, llm)
+        
+        results = [asyncio.run(resume_extractor.extract_async(SAMPLE_RESUME_TEXT)) for _ in range(3)]
+        
+        assert results == [ResumeData(name="John Doe", email="john.doe@example.com", skills=["Python", "Java"])] * 3
+    
+    def test_extract_inside_running_event_loop(self):
+        """Test the synchronous extract can be called from code already running an event loop."""
+        mock_name_extractor = Mock()
+        mock_name_extractor.extract.return_value = "John Doe"
+        resume_extractor = ResumeExtractor({'name': mock_name_extractor}, Mock())
+        
+        async def handler():
+            return resume_extractor.extract(SAMPLE_RESUME_TEXT)
+        
+        result = asyncio.run(handler())
+        
+        assert result.name == "John Doe"
+    
+    def test_extract_with_base_extractor_without_prompt(self):
+        """Test a BaseFieldExtractor subclass that builds no prompt raises NotImplementedError."""
+        class PhoneExtractor(BaseFieldExtractor):
+            pass
+        
+        with pytest.raises(NotImplementedError, match="PhoneExtractor must implement build_prompt"):
+            PhoneExtractor().extract(SAMPLE_RESUME_TEXT, Mock())
+    
+    def test_extract_with_duck_typed_extractor(self):
+        """Test an object defining only extract() is a FieldExtractor and can be used as one."""
+        class PhoneExtractor:
+            def extract(self, text, llm_interface):
+                return "123-456-7890"
+        
+        phone_extractor = PhoneExtractor()
+        resume_extractor = ResumeExtractor({'phone': phone_extractor}, Mock())
+        
+        assert isinstance(phone_extractor, FieldExtractor)
+        assert resume_extractor.extract(SAMPLE_RESUME_TEXT) == ResumeData(name="", email="", skills=[])
+
+
+class TestBatchedResumeExtractor:
+    """Test cases for BatchedResumeExtractor."""
+    
+    def test_init_builds_combined_schema(self, field_extractors):
+        """Test the response schema is assembled from the extractors' schema fragments."""
+        resume_extractor = BatchedResumeExtractor(field_extractors, Mock())
+        
+        assert resume_extractor.batched_fields == ['name', 'email', 'skills']
+        assert set(resume_extractor.response_schema.model_fields) == {'name', 'email', 'skills'}
+    
+    def test_init_skips_mock_extractors_without_schema(self, field_extractors):
+        """Test duck-typed extractors are not batched, even with a schema_fragment."""
+        extractors = field_extractors
+        extractors['summary'] = Mock()
+        extractors['phone'] = Mock(schema_fragment=(str, None))
+        
+        resume_extractor = BatchedResumeExtractor(extractors, Mock())
+        
+        assert resume_extractor.batched_fields == ['name', 'email', 'skills']
+    
+    def test_extract_single_llm_call(self, field_extractors):
+        """Test all fields are extracted with a single structured LLM call."""
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = (
+            '{"name": "John Doe", "email": "john.doe@example.com", "skills": ["Python", " Java ", ""]}'
+        )
+        
+        resume_extractor = BatchedResumeExtractor(field_extractors, mock_llm)
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
+        
+        assert result == ResumeData(name="John Doe", email="john.doe@example.com", skills=["Python", "Java"])
+        mock_llm.generate_response.assert_called_once()
+        kwargs = mock_llm.generate_response.call_args.kwargs
+        assert kwargs['response_mime_type'] == 'application/json'
+        assert kwargs['response_schema'] is resume_extractor.response_schema
+    
+    def test_extract_missing_fields_use_defaults(self, field_extractors):
+        """Test null fields in the structured response fall back to defaults."""
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = '{"name": "John Doe", "email": null, "skills": null}'
+        
+        resume_extractor = BatchedResumeExtractor(field_extractors, mock_llm)
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
+        
+        assert result == ResumeData(name="John Doe", email="", skills=[])
+    
+    def test_extract_retries_with_validation_feedback(self, field_extractors):
+        """Test an invalid response is retried with the validation error appended."""
+        mock_llm = Mock()
+        mock_llm.generate_response.side_effect = [
+            'not json',
+            '{"name": "John Doe", "email": "john.doe@example.com", "skills": ["Python"]}'
+        ]
+        
+        resume_extractor = BatchedResumeExtractor(field_extractors, mock_llm)
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
+        
+        assert result.name == "John Doe"
+        assert mock_llm.generate_response.call_count == 2
+        first_prompt = mock_llm.generate_response.call_args_list[0].args[0]
+        retry_call = mock_llm.generate_response.call_args_list[1]
+        assert "failed validation" in retry_call.args[0]
+        assert retry_call.kwargs['history'] == [('user', first_prompt), ('model', 'not json')]
+    
+    @patch('src.extractors.batched_resume_extractor.time.sleep')
+    def test_extract_backs_off_between_retries(self, mock_sleep, field_extractors):
+        """Test retries wait retry_backoff seconds multiplied by the retry number."""
+        mock_llm = Mock()
+        mock_llm.generate_response.side_effect = [
+            'not json',
+            'still not json',
+            '{"name": "John Doe", "email": "john.doe@example.com", "skills": ["Python"]}'
+        ]
+        
+        resume_extractor = BatchedResumeExtractor(field_extractors, mock_llm, retry_backoff=0.5)
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
+        
+        assert result.name == "John Doe"
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+        assert len(mock_llm.generate_response.call_args_list[2].kwargs['history']) == 4
+    
+    def test_extract_falls_back_to_individual_extractors(self, field_extractors):
+        """Test individual extractors are used once all retries fail validation."""
+        def generate_response(prompt, **kwargs):
+            if 'response_schema' in kwargs:
+                return 'not json'
+            if 'email address' in prompt:
+                return "john.doe@example.com"
+            if 'skills' in prompt:
+                return "Python,Java"
+            return "John Doe"
+        
+        mock_llm = Mock()
+        mock_llm.generate_response.side_effect = generate_response
+        
+        resume_extractor = BatchedResumeExtractor(field_extractors, mock_llm, max_retries=2)
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
+        
+        assert result == ResumeData(name="John Doe", email="john.doe@example.com", skills=["Python", "Java"])
+        # Three structured attempts plus name and skills; the email is found without the LLM
+        assert mock_llm.generate_response.call_count == 5
+    
+    def test_extract_runs_extractors_without_schema_individually(self, field_extractors):
+        """Test extractors without a schema fragment are run individually."""
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = (
+            '{"name": "John Doe", "email": "john.doe@example.com", "skills": ["Python"]}'
+        )
+        mock_phone_extractor = Mock()
+        mock_phone_extractor.extract.return_value = "123-456-7890"
+        extractors = field_extractors
+        extractors['phone'] = mock_phone_extractor
+        
+        resume_extractor = BatchedResumeExtractor(extractors, mock_llm)
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
+        
+        assert result.name == "John Doe"
+        assert 'phone' not in resume_extractor.batched_fields
+        mock_phone_extractor.extract.assert_called_once_with(SAMPLE_RESUME_TEXT, mock_llm)
+    
+    def test_extract_without_schema_fragments(self):
+        """Test extraction falls back to individual extractors when nothing can be batched."""
+        mock_llm = Mock()
+        mock_name_extractor = Mock()
+        mock_name_extractor.extract.return_value = "John Doe"
+        
+        resume_extractor = BatchedResumeExtractor({'name': mock_name_extractor}, mock_llm)
+        result = resume_extractor.extract(SAMPLE_RESUME_TEXT)
+        
+        assert resume_extractor.response_schema is None
+        assert result.name == "John Doe"
+        mock_llm.generate_response.assert_not_called()
+    
+    def test_extract_empty_text(self, field_extractors):
+        """Test extract raises ValueError for empty text."""
+        resume_extractor = BatchedResumeExtractor(field_extractors, Mock())
+        
+        with pytest.raises(ValueError, match="Text cannot be empty"):
+            resume_extractor.extract("   ")
 
+
+class TestBulkResumeExtractor:
+    """Test cases for BulkResumeExtractor."""
+    
+    def _bulk_response(self, *ids):
+        return json.dumps([
+            {'id': i, 'name': f"Candidate {i}", 'email': f"candidate{i}@example.com", 'skills': ["Python"]}
+            for i in ids
+        ])
+    
+    def test_init_invalid_batch_size(self, field_extractors):
+        """Test BulkResumeExtractor raises ValueError for a non-positive batch size."""
+        with pytest.raises(ValueError, match="batch_size must be positive"):
+            BulkResumeExtractor(field_extractors, Mock(), batch_size=0)
+    
+    def test_init_without_schema_fragments(self):
+        """Test BulkResumeExtractor requires extractors with schema fragments."""
+        with pytest.raises(ValueError, match="schema_fragment"):
+            BulkResumeExtractor({'name': Mock()}, Mock())
+    
+    def test_extract_single_call_per_batch(self, field_extractors):
+        """Test several resumes are extracted with one LLM call, in input order."""
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = self._bulk_response(2, 0, 1)
+        
+        bulk_extractor = BulkResumeExtractor(field_extractors, mock_llm, batch_size=4)
+        results = bulk_extractor.extract([f"Resume {i}\n{SAMPLE_RESUME_TEXT}" for i in range(3)])
+        
+        assert [result.name for result in results] == ["Candidate 0", "Candidate 1", "Candidate 2"]
+        assert results[0] == ResumeData(name="Candidate 0", email="candidate0@example.com", skills=["Python"])
+        mock_llm.generate_response.assert_called_once()
+        prompt = mock_llm.generate_response.call_args[0][0]
+        assert "---RESUME id=0---\nResume 0" in prompt
+        assert "---RESUME id=2---\nResume 2" in prompt
+        assert mock_llm.generate_response.call_args.kwargs['response_mime_type'] == 'application/json'
+    
+    def test_extract_splits_into_batches(self, field_extractors):
+        """Test resumes are split into batches of at most batch_size."""
+        mock_llm = Mock()
+        mock_llm.generate_response.side_effect = [
+            self._bulk_response(0, 1),
+            self._bulk_response(0, 1),
+            self._bulk_response(0)
+        ]
+        
+        bulk_extractor = BulkResumeExtractor(field_extractors, mock_llm, batch_size=2)
+        results = bulk_extractor.extract([SAMPLE_RESUME_TEXT] * 5)
+        
+        assert len(results) == 5
+        assert mock_llm.generate_response.call_count == 3
+    
+    def test_extract_scales_output_tokens_with_batch(self, field_extractors):
+        """Test the output token cap covers every resume of the batch, not just one."""
+        mock_llm = Mock()
+        mock_llm.generate_response.side_effect = [self._bulk_response(0, 1, 2), self._bulk_response(0)]
+        
+        bulk_extractor = BulkResumeExtractor(field_extractors, mock_llm, batch_size=3)
+        bulk_extractor.extract([SAMPLE_RESUME_TEXT] * 4)
+        
+        per_resume = sum(extractor.max_output_tokens for extractor in field_extractors.values()) + 16
+        assert [call.kwargs['max_output_tokens'] for call in mock_llm.generate_response.call_args_list] == [
+            per_resume * 3, per_resume
+        ]
+    
+    def test_extract_remaining_fields_concurrently_across_batch(self, field_extractors):
+        """Test extractors without a schema_fragment run concurrently for every resume of the batch."""
+        barrier = threading.Barrier(2, timeout=5)
+        
+        class PhoneExtractor:
+            def extract(self, text, llm_interface):
+                barrier.wait()
+                return text.split("\n", 1)[0]
+        
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = self._bulk_response(0, 1)
+        extractors = {**field_extractors, 'phone': PhoneExtractor()}
+        
+        bulk_extractor = BulkResumeExtractor(extractors, mock_llm)
+        with patch.object(bulk_extractor.resume_extractor, 'build_resume_data',
+                          wraps=bulk_extractor.resume_extractor.build_resume_data) as build_resume_data:
+            results = bulk_extractor.extract([f"Resume {i}\n{SAMPLE_RESUME_TEXT}" for i in range(2)])
+        
+        assert [result.name for result in results] == ["Candidate 0", "Candidate 1"]
+        assert [call.args[0]['phone'] for call in build_resume_data.call_args_list] == ["Resume 0", "Resume 1"]
+        mock_llm.generate_response.assert_called_once()
+    
+    def test_extract_falls_back_for_missing_ids(self, field_extractors):
+        """Test resumes missing from the bulk response are extracted individually."""
+        mock_llm = Mock()
+        mock_llm.generate_response.side_effect = [
+            self._bulk_response(0),
+            '{"name": "Single", "email": "single@example.com", "skills": ["Java"]}'
+        ]
+        
+        bulk_extractor = BulkResumeExtractor(field_extractors, mock_llm)
+        results = bulk_extractor.extract([SAMPLE_RESUME_TEXT] * 2)
+        
+        assert results[0].name == "Candidate 0"
+        assert results[1] == ResumeData(name="Single", email="single@example.com", skills=["Java"])
+        assert mock_llm.generate_response.call_count == 2
+    
+    def test_extract_falls_back_on_invalid_response(self, field_extractors):
+        """Test an invalid bulk response falls back to single-resume extraction."""
+        mock_llm = Mock()
+        mock_llm.generate_response.side_effect = [
+            'not json',
+            '{"name": "Single", "email": null, "skills": null}'
+        ]
+        
+        bulk_extractor = BulkResumeExtractor(field_extractors, mock_llm)
+        results = bulk_extractor.extract([SAMPLE_RESUME_TEXT])
+        
+        assert results == [ResumeData(name="Single", email="", skills=[])]
+    
+    def test_extract_skips_degenerate_texts(self, field_extractors):
+        """Test degenerate texts get empty data and are left out of the bulk prompt."""
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = self._bulk_response(0)
+        
+        bulk_extractor = BulkResumeExtractor(field_extractors, mock_llm)
+        results = bulk_extractor.extract(["Page 1 \x0c", f"Resume 1\n{SAMPLE_RESUME_TEXT}"])
+        
+        assert results == [
+            ResumeData(name="", email="", skills=[]),
+            ResumeData(name="Candidate 0", email="candidate0@example.com", skills=["Python"])
+        ]
+        prompt = mock_llm.generate_response.call_args[0][0]
+        assert "---RESUME id=0---\nResume 1" in prompt
+        assert "id=1" not in prompt
+    
+    def test_extract_empty_text(self, field_extractors):
+        """Test extract raises ValueError if any text is empty."""
+        bulk_extractor = BulkResumeExtractor(field_extractors, Mock())
+        
+        with pytest.raises(ValueError, match="Text cannot be empty"):
+            bulk_extractor.extract(["Resume 0", "  "])
@@ -1,23 +1,97 @@
 """Tests for ResumeParserFramework."""
 
+import threading
+
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from docx import Document
+
 from src.framework.resume_parser_framework import ResumeParserFramework
 from src.parsers.pdf_parser import PDFParser
 from src.parsers.word_parser import WordParser
 from src.extractors.resume_extractor import ResumeExtractor
+from src.llm.gemini_llm import GeminiLLM
 from src.models.resume import ResumeData
 
+from .conftest import SAMPLE_RESUME_TEXT
+
+PDF_PATH = Path("test.pdf")
+DOCX_PATH = Path("test.docx")
+
+
+@pytest.fixture(scope="session")
+def fake_pdf(tmp_path_factory):
+    """A dummy resume.pdf written once per session; tests only read it."""
+    file_path = tmp_path_factory.mktemp("resumes") / "resume.pdf"
+    file_path.write_bytes(b"fake pdf content")
+    return file_path
+
+
+@pytest.fixture(scope="session")
+def fake_docx(tmp_path_factory):
+    """A real resume.docx containing SAMPLE_RESUME_TEXT, written once per session."""
+    file_path = tmp_path_factory.mktemp("resumes") / "resume.docx"
+    document = Document()
+    document.add_paragraph(SAMPLE_RESUME_TEXT)
+    document.save(file_path)
+    return file_path
+
+
+@pytest.fixture(scope="module")
+def default_framework():
+    """A framework with the default parsers, for tests that never reach extraction."""
+    return ResumeParserFramework(Mock())
+
+
+@pytest.fixture(scope="module")
+def pdf_parser_proto():
+    """A PDFParser mock built once per module, since building a spec'd Mock introspects the class."""
+    return Mock(spec=PDFParser)
+
+
+@pytest.fixture
+def mock_parser(pdf_parser_proto):
+    """The module's PDFParser mock with its calls, return values and side effects reset."""
+    # copy.copy() would share child mocks such as parse() with the prototype,
+    # so the prototype itself is handed out after a full reset.
+    pdf_parser_proto.reset_mock(return_value=True, side_effect=True)
+    return pdf_parser_proto
+
+
+@pytest.fixture
+def mock_extractor():
+    """A mock resume extractor, configured per test."""
+    return Mock()
+
+
+@pytest.fixture
+def mock_field_extractors():
+    """A dictionary of mock name, email and skills extractors."""
+    return {'name': Mock(), 'email': Mock(), 'skills': Mock()}
+
+
+@pytest.fixture
+def resume_extractor(mock_field_extractors):
+    """A ResumeExtractor over mock_field_extractors, whose results tests configure."""
+    return ResumeExtractor(mock_field_extractors, Mock())
+
+
+@pytest.fixture
+def standard_resume_extractor(resume_extractor, mock_field_extractors):
+    """A ResumeExtractor whose field extractors return John Doe's details."""
+    mock_field_extractors['name'].extract.return_value = "John Doe"
+    mock_field_extractors['email'].extract.return_value = "john.doe@example.com"
+    mock_field_extractors['skills'].extract.return_value = ["Python", "Java"]
+    return resume_extractor
+
 
 class TestResumeParserFramework:
     """Test cases for ResumeParserFramework."""
     
-    def test_init_with_default_parsers(self):
+    def test_init_with_default_parsers(self, mock_extractor):
         """Test ResumeParserFramework initialization with default parsers."""
-        mock_extractor = Mock()
-        
         framework = ResumeParserFramework(mock_extractor)
         
         assert len(framework.parsers) == 2
@@ -25,9 +99,8 @@ class TestResumeParserFramework:
         assert isinstance(framework.parsers[1], WordParser)
         assert framework.resume_extractor == mock_extractor
     
-    def test_init_with_custom_parsers(self):
+    def test_init_with_custom_parsers(self, mock_extractor):
         """Test ResumeParserFramework initialization with custom parsers."""
-        mock_extractor = Mock()
         custom_parsers = [PDFParser()]
         
         framework = ResumeParserFramework(mock_extractor, parsers=custom_parsers)
@@ -35,110 +108,57 @@ class TestResumeParserFramework:
         assert framework.parsers == custom_parsers
         assert framework.resume_extractor == mock_extractor
     
-    def test_init_with_empty_parsers(self):
+    def test_init_with_empty_parsers(self, mock_extractor):
         """Test ResumeParserFramework raises ValueError with empty parsers list."""
-        mock_extractor = Mock()
-        
         with pytest.raises(ValueError, match="Parsers list cannot be empty"):
             ResumeParserFramework(mock_extractor, parsers=[])
     
-    def test_parse_resume_success(self, tmp_path):
+    def test_parse_resume_success(self, mock_parser, fake_pdf, standard_resume_extractor):
         """Test successful resume parsing with automatic parser selection."""
         # Setup
-        file_path = tmp_path / "resume.pdf"
-        file_path.write_bytes(b"fake pdf content")
-        
-        mock_parser = Mock(spec=PDFParser)
-        mock_parser.parse.return_value = "Resume text content"
+        mock_parser.parse.return_value = SAMPLE_RESUME_TEXT
         mock_parser.can_parse.return_value = True
         mock_parser.get_supported_extensions.return_value = ['.pdf']
         
-        mock_llm = Mock()
-        mock_name_extractor = Mock()
-        mock_name_extractor.extract.return_value = "John Doe"
-        
-        mock_email_extractor = Mock()
-        mock_email_extractor.extract.return_value = "john.doe@example.com"
-        
-        mock_skills_extractor = Mock()
-        mock_skills_extractor.extract.return_value = ["Python", "Java"]
-        
-        extractors_mock = {
-            'name': mock_name_extractor,
-            'email': mock_email_extractor,
-            'skills': mock_skills_extractor
-        }
-        
-        resume_extractor = ResumeExtractor(extractors_mock, mock_llm)
-        
-        framework = ResumeParserFramework(resume_extractor, parsers=[mock_parser])
+        framework = ResumeParserFramework(standard_resume_extractor, parsers=[mock_parser])
         
         # Execute
-        result = framework.parse_resume(str(file_path))
+        result = framework.parse_resume(str(fake_pdf))
         
         # Assert
         assert isinstance(result, ResumeData)
         assert result.name == "John Doe"
         assert result.email == "john.doe@example.com"
         assert result.skills == ["Python", "Java"]
-        mock_parser.parse.assert_called_once_with(Path(file_path))
-        mock_parser.can_parse.assert_called_once_with(Path(file_path))
-    
-    def test_parse_resume_file_not_found(self):
-        """Test parse_resume raises FileNotFoundError for non-existent file."""
-        mock_parser = Mock(spec=PDFParser)
-        mock_parser.can_parse.return_value = True
-        mock_parser.parse.side_effect = FileNotFoundError("File not found")
-        
-        mock_extractor = Mock()
-        
-        framework = ResumeParserFramework(mock_extractor, parsers=[mock_parser])
-        
-        with pytest.raises(FileNotFoundError):
-            framework.parse_resume("nonexistent.pdf")
+        mock_parser.parse.assert_called_once_with(fake_pdf)
+        mock_parser.can_parse.assert_called_once_with(fake_pdf)
     
-    def test_parse_resume_invalid_format(self):
-        """Test parse_resume raises ValueError for invalid file format."""
-        mock_parser = Mock(spec=PDFParser)
+    @pytest.mark.parametrize("error", [
+        FileNotFoundError("File not found"),
+        ValueError("Invalid file format"),
+        IOError("Cannot read file"),
+    ], ids=lambda error: type(error).__name__)
+    def test_parse_resume_propagates_parser_errors(self, mock_extractor, mock_parser, error):
+        """Test parse_resume propagates missing-file, invalid-format and read errors from the parser."""
         mock_parser.can_parse.return_value = True
-        mock_parser.parse.side_effect = ValueError("Invalid file format")
-        
-        mock_extractor = Mock()
+        mock_parser.parse.side_effect = error
         
         framework = ResumeParserFramework(mock_extractor, parsers=[mock_parser])
         
-        with pytest.raises(ValueError):
-            framework.parse_resume("invalid.pdf")
+        with pytest.raises(type(error), match=str(error)):
+            framework.parse_resume("test.pdf")
+        mock_extractor.extract.assert_not_called()
     
-    def test_parse_resume_unsupported_extension(self):
+    def test_parse_resume_unsupported_extension(self, default_framework):
         """Test parse_resume raises ValueError for unsupported file extension."""
-        mock_extractor = Mock()
-        
-        framework = ResumeParserFramework(mock_extractor)
-        
         with pytest.raises(ValueError, match="No parser available for file extension"):
-            framework.parse_resume("file.xyz")
-    
-    def test_parse_resume_io_error(self):
-        """Test parse_resume raises IOError for file read errors."""
-        mock_parser = Mock(spec=PDFParser)
-        mock_parser.can_parse.return_value = True
-        mock_parser.parse.side_effect = IOError("Cannot read file")
-        
-        mock_extractor = Mock()
-        
-        framework = ResumeParserFramework(mock_extractor, parsers=[mock_parser])
-        
-        with pytest.raises(IOError):
-            framework.parse_resume("test.pdf")
+            default_framework.parse_resume("file.xyz")
     
-    def test_parse_resume_extraction_failure(self):
+    def test_parse_resume_extraction_failure(self, mock_extractor, mock_parser):
         """Test parse_resume handles extraction failures."""
-        mock_parser = Mock(spec=PDFParser)
         mock_parser.can_parse.return_value = True
         mock_parser.parse.return_value = "Resume text"
         
-        mock_extractor = Mock()
         mock_extractor.extract.side_effect = ValueError("Extraction failed")
         
         framework = ResumeParserFramework(mock_extractor, parsers=[mock_parser])
@@ -146,82 +166,38 @@ class TestResumeParserFramework:
         with pytest.raises(ValueError, match="Extraction failed"):
             framework.parse_resume("test.pdf")
     
-    def test_parse_resume_with_pdf_parser(self, tmp_path):
+    def test_parse_resume_with_pdf_parser(self, fake_pdf, standard_resume_extractor):
         """Test parse_resume with actual PDFParser (mocked)."""
-        file_path = tmp_path / "resume.pdf"
-        file_path.write_bytes(b"content")
-        
         with patch('src.parsers.pdf_parser.pypdf.PdfReader') as mock_reader:
             mock_page = Mock()
-            mock_page.extract_text.return_value = "Resume content"
+            mock_page.extract_text.return_value = SAMPLE_RESUME_TEXT
             mock_reader.return_value.pages = [mock_page]
             
-            pdf_parser = PDFParser()
-            
-            mock_llm = Mock()
-            mock_name_extractor = Mock()
-            mock_name_extractor.extract.return_value = "John Doe"
-            mock_email_extractor = Mock()
-            mock_email_extractor.extract.return_value = "john@example.com"
-            mock_skills_extractor = Mock()
-            mock_skills_extractor.extract.return_value = ["Python"]
-            
-            extractors = {
-                'name': mock_name_extractor,
-                'email': mock_email_extractor,
-                'skills': mock_skills_extractor
-            }
-            
-            resume_extractor = ResumeExtractor(extractors, mock_llm)
-            framework = ResumeParserFramework(resume_extractor)
+            framework = ResumeParserFramework(standard_resume_extractor)
             
-            result = framework.parse_resume(str(file_path))
+            result = framework.parse_resume(str(fake_pdf))
             
             assert isinstance(result, ResumeData)
             assert result.name == "John Doe"
     
-    def test_parse_resume_with_word_parser(self, tmp_path):
-        """Test parse_resume with actual WordParser (mocked)."""
-        file_path = tmp_path / "resume.docx"
-        file_path.write_bytes(b"content")
-        
-        with patch('src.parsers.word_parser.Document') as mock_document:
-            mock_doc = Mock()
-            mock_doc.paragraphs = [Mock(text="Resume content")]
-            mock_doc.tables = []
-            mock_document.return_value = mock_doc
-            
-            word_parser = WordParser()
-            
-            mock_llm = Mock()
-            mock_name_extractor = Mock()
-            mock_name_extractor.extract.return_value = "Jane Smith"
-            mock_email_extractor = Mock()
-            mock_email_extractor.extract.return_value = "jane@example.com"
-            mock_skills_extractor = Mock()
-            mock_skills_extractor.extract.return_value = ["Java"]
-            
-            extractors = {
-                'name': mock_name_extractor,
-                'email': mock_email_extractor,
-                'skills': mock_skills_extractor
-            }
-            
-            resume_extractor = ResumeExtractor(extractors, mock_llm)
-            framework = ResumeParserFramework(resume_extractor)
-            
-            result = framework.parse_resume(str(file_path))
-            
-            assert isinstance(result, ResumeData)
-            assert result.name == "Jane Smith"
+    def test_parse_resume_with_word_parser(self, fake_docx, resume_extractor, mock_field_extractors):
+        """Test parse_resume with actual WordParser on a real .docx file."""
+        mock_field_extractors['name'].extract.return_value = "Jane Smith"
+        mock_field_extractors['email'].extract.return_value = "jane@example.com"
+        mock_field_extractors['skills'].extract.return_value = ["Java"]
+        
+        framework = ResumeParserFramework(resume_extractor)
+        
+        result = framework.parse_resume(str(fake_docx))
+        
+        assert isinstance(result, ResumeData)
+        assert result.name == "Jane Smith"
     
-    def test_parse_resume_path_conversion(self):
+    def test_parse_resume_path_conversion(self, mock_extractor, mock_parser):
         """Test parse_resume converts string path to Path object."""
-        mock_parser = Mock(spec=PDFParser)
         mock_parser.can_parse.return_value = True
         mock_parser.parse.return_value = "Resume text"
         
-        mock_extractor = Mock()
         mock_extractor.extract.return_value = ResumeData(
             name="Test",
             email="test@example.com",
@@ -230,30 +206,173 @@ class TestResumeParserFramework:
         
         framework = ResumeParserFramework(mock_extractor, parsers=[mock_parser])
         
-        framework.parse_resume("test.pdf")
+        framework.parse_resume(str(PDF_PATH))
         
         # Verify parse was called with Path object
         call_args = mock_parser.parse.call_args[0]
         assert isinstance(call_args[0], Path)
-        assert str(call_args[0]) == "test.pdf"
+        assert call_args[0] == PDF_PATH
     
-    def test_select_parser_for_pdf(self):
-        """Test parser selection for PDF files."""
-        mock_extractor = Mock()
-        framework = ResumeParserFramework(mock_extractor)
+    @pytest.mark.parametrize("path,parser_class", [
+        (PDF_PATH, PDFParser),
+        (DOCX_PATH, WordParser),
+    ])
+    def test_select_parser(self, default_framework, path, parser_class):
+        """Test parser selection by file extension."""
+        assert isinstance(default_framework._select_parser(path), parser_class)
+    
+    def test_parse_resume_with_cache(self, mock_extractor, mock_parser, tmp_path):
+        """Test a cached resume is returned without re-parsing or re-extracting."""
+        file_path = tmp_path / "resume.pdf"
+        file_path.write_bytes(b"fake pdf content")
+        
+        mock_parser.can_parse.return_value = True
+        mock_parser.parse_bytes.return_value = "Resume text"
+        
+        mock_extractor.extract.return_value = ResumeData(
+            name="John Doe",
+            email="john.doe@example.com",
+            skills=["Python"]
+        )
+        
+        framework = ResumeParserFramework(mock_extractor, parsers=[mock_parser], cache_dir=tmp_path / "cache")
         
-        pdf_path = Path("test.pdf")
-        selected_parser = framework._select_parser(pdf_path)
+        first = framework.parse_resume(str(file_path))
+        second = framework.parse_resume(str(file_path))
         
-        assert isinstance(selected_parser, PDFParser)
+        assert first == second == mock_extractor.extract.return_value
+        mock_parser.parse_bytes.assert_called_once_with(b"fake pdf content", file_path)
+        mock_parser.parse.assert_not_called()
+        mock_extractor.extract.assert_called_once_with("Resume text")
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 1
     
-    def test_select_parser_for_word(self):
-        """Test parser selection for Word files."""
-        mock_extractor = Mock()
-        framework = ResumeParserFramework(mock_extractor)
+    def test_parse_resume_cache_keyed_by_content(self, mock_extractor, mock_parser, tmp_path):
+        """Test changing the file content invalidates the cached resume."""
+        file_path = tmp_path / "resume.pdf"
+        file_path.write_bytes(b"fake pdf content")
         
-        word_path = Path("test.docx")
-        selected_parser = framework._select_parser(word_path)
+        mock_parser.can_parse.return_value = True
+        mock_parser.parse_bytes.return_value = "Resume text"
         
-        assert isinstance(selected_parser, WordParser)
-
+        mock_extractor.extract.return_value = ResumeData(name="John Doe", email="", skills=[])
+        
+        framework = ResumeParserFramework(mock_extractor, parsers=[mock_parser], cache_dir=tmp_path / "cache")
+        
+        framework.parse_resume(str(file_path))
+        file_path.write_bytes(b"updated pdf content")
+        framework.parse_resume(str(file_path))
+        
+        assert mock_extractor.extract.call_count == 2
+    
+    def test_parse_resume_cache_keyed_by_extractors(self, mock_parser, tmp_path, name_extractor, email_extractor):
+        """Test frameworks with different field extractors do not share cache entries."""
+        cache_dir = tmp_path / "cache"
+        name_framework = ResumeParserFramework(
+            ResumeExtractor({'name': name_extractor}, Mock()), parsers=[mock_parser], cache_dir=cache_dir
+        )
+        email_framework = ResumeParserFramework(
+            ResumeExtractor({'email': email_extractor}, Mock()), parsers=[mock_parser], cache_dir=cache_dir
+        )
+        
+        assert name_framework._cache_key(b"fake pdf content") != email_framework._cache_key(b"fake pdf content")
+    
+    def test_parse_resume_does_not_cache_empty_result(self, mock_extractor, mock_parser, tmp_path):
+        """Test an empty extraction result is retried instead of being served from the cache."""
+        file_path = tmp_path / "resume.pdf"
+        file_path.write_bytes(b"fake pdf content")
+        
+        mock_parser.can_parse.return_value = True
+        mock_parser.parse_bytes.return_value = "Resume text"
+        
+        mock_extractor.extract.return_value = ResumeData(name="", email="", skills=[])
+        
+        framework = ResumeParserFramework(mock_extractor, parsers=[mock_parser], cache_dir=tmp_path / "cache")
+        
+        framework.parse_resume(str(file_path))
+        framework.parse_resume(str(file_path))
+        
+        assert mock_extractor.extract.call_count == 2
+        assert not list((tmp_path / "cache").glob("*.json"))
+    
+    def test_parse_resume_cache_ignores_corrupt_entry(self, mock_extractor, mock_parser, tmp_path):
+        """Test an unreadable cache entry is treated as a cache miss."""
+        file_path = tmp_path / "resume.pdf"
+        file_path.write_bytes(b"fake pdf content")
+        
+        mock_parser.can_parse.return_value = True
+        mock_parser.parse_bytes.return_value = "Resume text"
+        
+        mock_extractor.extract.return_value = ResumeData(name="John Doe", email="", skills=[])
+        
+        cache_dir = tmp_path / "cache"
+        framework = ResumeParserFramework(mock_extractor, parsers=[mock_parser], cache_dir=cache_dir)
+        (cache_dir / f"{framework._cache_key(b'fake pdf content')}.json").write_text("not json")
+        
+        result = framework.parse_resume(str(file_path))
+        
+        assert result.name == "John Doe"
+        mock_extractor.extract.assert_called_once()
+    
+    def test_parse_resumes_preserves_order(self, mock_extractor, mock_parser):
+        """Test batch parsing returns results in input order."""
+        mock_parser.can_parse.return_value = True
+        mock_parser.parse.side_effect = lambda path: f"Resume text for {path.name}"
+        
+        mock_extractor.extract.side_effect = lambda text: ResumeData(name=text, email="", skills=[])
+        
+        framework = ResumeParserFramework(mock_extractor, parsers=[mock_parser])
+        
+        results = framework.parse_resumes(["a.pdf", "b.pdf", "c.pdf"], max_workers=2)
+        
+        assert [result.name for result in results] == [
+            "Resume text for a.pdf",
+            "Resume text for b.pdf",
+            "Resume text for c.pdf"
+        ]
+    
+    def test_parse_resumes_runs_concurrently(self, mock_extractor, mock_parser):
+        """Test batch parsing processes resumes at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+        
+        mock_parser.can_parse.return_value = True
+        mock_parser.parse.return_value = "Resume text"
+        
+        def extract(text):
+            barrier.wait()
+            return ResumeData(name="John Doe", email="", skills=[])
+        
+        mock_extractor.extract.side_effect = extract
+        
+        framework = ResumeParserFramework(mock_extractor, parsers=[mock_parser])
+        
+        results = framework.parse_resumes(["a.pdf", "b.pdf"])
+        
+        assert len(results) == 2
+    
+    def test_parse_resumes_propagates_errors(self, mock_extractor, mock_parser):
+        """Test batch parsing raises the error of a failing resume."""
+        mock_parser.can_parse.return_value = True
+        mock_parser.parse.side_effect = FileNotFoundError("File not found")
+        
+        framework = ResumeParserFramework(mock_extractor, parsers=[mock_parser])
+        
+        with pytest.raises(FileNotFoundError):
+            framework.parse_resumes(["missing.pdf"])
+    
+    def test_parse_resumes_with_gemini(self, field_extractors, fake_gemini_url, fake_docx):
+        """Test concurrent batch parsing through a real Gemini client and ResumeExtractor."""
+        llm = GeminiLLM(api_key="test-key", base_url=fake_gemini_url)
+        framework = ResumeParserFramework(ResumeExtractor(field_extractors, llm))
+        
+        results = framework.parse_resumes([str(fake_docx)] * 16, max_workers=8)
+        
+        assert results == [ResumeData(name="John Doe", email="john.doe@example.com", skills=["Python", "Java"])] * 16
+    
+    def test_parse_resumes_empty(self, default_framework):
+        """Test batch parsing an empty list returns an empty list."""
+        assert default_framework.parse_resumes([]) == []
+    
+    def test_parse_resumes_invalid_max_workers(self, default_framework):
+        """Test batch parsing raises ValueError for a non-positive worker count."""
+        with pytest.raises(ValueError, match="max_workers must be positive"):
+            default_framework.parse_resumes(["a.pdf"], max_workers=0)
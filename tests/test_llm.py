@@ -1,107 +1,232 @@
 """Tests for LLM interfaces."""
 
+import asyncio
+import json
 import pytest
-import os
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
-from src.llm.gemini_llm import GeminiLLM
-from src.llm.llm_interface import LLMInterface
+from src.llm.cache import LLMCache, PROMPT_VERSION
+from src.llm.gemini_llm import GeminiLLM, _async_clients, _get_client
+from src.llm.llm_interface import BaseLLMInterface, LLMInterface
+from src.llm.rate_limiter import RateLimiter
+
+
+@pytest.fixture(autouse=True)
+def clear_gemini_client_cache():
+    """Ensure each test constructs its own (mocked) Gemini clients."""
+    _get_client.cache_clear()
+    _async_clients.clear()
+    yield
+    _get_client.cache_clear()
+    _async_clients.clear()
+
+
+def _config_of(client):
+    """Return the generation config passed in the client's last generate_content call."""
+    return client.models.generate_content.call_args.kwargs['config']
+
+
+@pytest.fixture(scope="module")
+def mock_genai(module_mocker):
+    """Patch genai and provide an API key for every GeminiLLM built in this module."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv('GEMINI_API_KEY', 'test-api-key')
+        yield module_mocker.patch('src.llm.gemini_llm.genai')
+
+
+@pytest.fixture(scope="module")
+def gemini_llm(mock_genai):
+    """A GeminiLLM with default settings, constructed once per module."""
+    return GeminiLLM()
+
+
+@pytest.fixture
+def mock_client(mock_genai):
+    """The mocked genai client, with calls and configured responses reset for each test."""
+    mock_genai.reset_mock()
+    client = mock_genai.Client.return_value
+    client.reset_mock(return_value=True, side_effect=True)
+    return client
+
+
+class _ConcreteLLM(BaseLLMInterface):
+    """Minimal BaseLLMInterface subclass for exercising the default methods."""
+    
+    def generate_response(self, prompt: str, **kwargs) -> str:
+        return ""
+
+
+@pytest.fixture(scope="module")
+def concrete_llm():
+    """A stateless _ConcreteLLM shared by the tests of this module."""
+    return _ConcreteLLM()
 
 
 class TestLLMInterface:
-    """Test cases for LLMInterface abstract class."""
+    """Test cases for LLMInterface protocol."""
     
-    def test_validate_prompt_none(self):
-        """Test validate_prompt raises ValueError for None."""
-        # Create a concrete implementation for testing
-        class TestLLM(LLMInterface):
+    def test_structural_isinstance(self):
+        """Test objects defining only generate_response satisfy the protocol without subclassing."""
+        class DuckLLM:
             def generate_response(self, prompt: str, **kwargs) -> str:
                 return ""
         
-        llm = TestLLM()
-        
-        with pytest.raises(ValueError, match="Prompt cannot be None"):
-            llm.validate_prompt(None)
+        assert isinstance(DuckLLM(), LLMInterface)
+        assert isinstance(_ConcreteLLM(), LLMInterface)
+        assert not isinstance(object(), LLMInterface)
     
-    def test_validate_prompt_not_string(self):
-        """Test validate_prompt raises ValueError for non-string."""
-        class TestLLM(LLMInterface):
-            def generate_response(self, prompt: str, **kwargs) -> str:
-                return ""
+    @pytest.mark.parametrize("prompt,match", [
+        (None, "Prompt cannot be None"),
+        (123, "Prompt must be a string"),
+        ([], "Prompt must be a string"),
+        ({}, "Prompt must be a string"),
+        ("", "Prompt cannot be empty"),
+        ("   ", "Prompt cannot be empty"),
+    ])
+    def test_validate_prompt_invalid(self, concrete_llm, prompt, match):
+        """Test validate_prompt raises ValueError for None, non-string and blank prompts."""
+        with pytest.raises(ValueError, match=match):
+            concrete_llm.validate_prompt(prompt)
+    
+    @pytest.mark.parametrize("text,match", [
+        (None, "Text cannot be None"),
+        (123, "Text must be a string"),
+        ([], "Text must be a string"),
+        ({}, "Text must be a string"),
+        ("", "Text cannot be empty"),
+        ("   ", "Text cannot be empty"),
+    ])
+    def test_validate_text_invalid(self, concrete_llm, text, match):
+        """Test validate_text raises ValueError for None, non-string and blank text."""
+        with pytest.raises(ValueError, match=match):
+            concrete_llm.validate_text(text)
+    
+    def test_generate_response_not_implemented(self):
+        """Test a BaseLLMInterface subclass without generate_response raises NotImplementedError."""
+        class IncompleteLLM(BaseLLMInterface):
+            pass
         
-        llm = TestLLM()
+        with pytest.raises(NotImplementedError, match="IncompleteLLM must implement generate_response"):
+            IncompleteLLM().generate_response("Test")
+    
+    def test_generate_response_async_default(self, concrete_llm):
+        """Test the default generate_response_async delegates to generate_response."""
+        with patch.object(concrete_llm, 'generate_response', return_value="Generated response") as mock_generate:
+            result = asyncio.run(concrete_llm.generate_response_async("Test", suffix="prompt"))
         
-        with pytest.raises(ValueError, match="Prompt must be a string"):
-            llm.validate_prompt(123)
+        assert result == "Generated response"
+        mock_generate.assert_called_once_with("Test", suffix="prompt")
+
+
+class TestLLMCache:
+    """Test cases for LLMCache."""
+    
+    def test_get_missing_key(self, tmp_path):
+        """Test get returns None for a key that was never stored."""
+        cache = LLMCache(tmp_path / "cache")
         
-        # Test with different non-string types to ensure full coverage
-        with pytest.raises(ValueError, match="Prompt must be a string"):
-            llm.validate_prompt([])
-        with pytest.raises(ValueError, match="Prompt must be a string"):
-            llm.validate_prompt({})
+        assert cache.get(LLMCache.make_key("model", "prompt")) is None
     
-    def test_validate_prompt_empty(self):
-        """Test validate_prompt raises ValueError for empty string."""
-        class TestLLM(LLMInterface):
-            def generate_response(self, prompt: str, **kwargs) -> str:
-                return ""
+    def test_set_and_get(self, tmp_path):
+        """Test a stored response is returned and persisted as JSON."""
+        cache = LLMCache(tmp_path)
+        key = LLMCache.make_key("model", "prompt")
+        
+        cache.set(key, "response", model_name="model")
+        
+        assert cache.get(key) == "response"
+        entry = json.loads((tmp_path / f"{key}.json").read_text())
+        assert entry['response'] == "response"
+        assert entry['model'] == "model"
+        assert 'created_at' in entry
+    
+    def test_make_key_depends_on_inputs(self):
+        """Test the key changes with the model, prompt and parameters."""
+        key = LLMCache.make_key("model", "prompt", temperature=0.0)
+        
+        assert len(key) == 64
+        assert key == LLMCache.make_key("model", "prompt", temperature=0.0)
+        assert key != LLMCache.make_key("other-model", "prompt", temperature=0.0)
+        assert key != LLMCache.make_key("model", "other prompt", temperature=0.0)
+        assert key != LLMCache.make_key("model", "prompt", temperature=0.5)
+    
+    def test_make_key_depends_on_prompt_version(self):
+        """Test the key changes when the prompt version is bumped."""
+        key = LLMCache.make_key("model", "prompt")
         
-        llm = TestLLM()
+        with patch('src.llm.cache.PROMPT_VERSION', PROMPT_VERSION + "-next"):
+            assert LLMCache.make_key("model", "prompt") != key
+    
+    def test_get_corrupt_entry(self, tmp_path):
+        """Test an unreadable entry is treated as a cache miss."""
+        cache = LLMCache(tmp_path)
+        key = LLMCache.make_key("model", "prompt")
+        (tmp_path / f"{key}.json").write_text("not json")
         
-        with pytest.raises(ValueError, match="Prompt cannot be empty"):
-            llm.validate_prompt("")
-        with pytest.raises(ValueError, match="Prompt cannot be empty"):
-            llm.validate_prompt("   ")
+        assert cache.get(key) is None
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
     
-    def test_validate_text_none(self):
-        """Test validate_text raises ValueError for None."""
-        class TestLLM(LLMInterface):
-            def generate_response(self, prompt: str, **kwargs) -> str:
-                return ""
+    def test_init_invalid_rate(self):
+        """Test RateLimiter raises ValueError for a non-positive rate."""
+        with pytest.raises(ValueError, match="requests_per_minute must be positive"):
+            RateLimiter(0)
+    
+    @patch('src.llm.rate_limiter.time')
+    def test_acquire_within_burst_does_not_wait(self, mock_time):
+        """Test requests within the burst size are not delayed."""
+        mock_time.monotonic.return_value = 100.0
+        limiter = RateLimiter(60, burst=2)
         
-        llm = TestLLM()
+        limiter.acquire()
+        limiter.acquire()
         
-        with pytest.raises(ValueError, match="Text cannot be None"):
-            llm.validate_text(None)
+        mock_time.sleep.assert_not_called()
     
-    def test_validate_text_not_string(self):
-        """Test validate_text raises ValueError for non-string."""
-        class TestLLM(LLMInterface):
-            def generate_response(self, prompt: str, **kwargs) -> str:
-                return ""
+    @patch('src.llm.rate_limiter.time')
+    def test_acquire_beyond_burst_waits(self, mock_time):
+        """Test requests beyond the burst size wait for the bucket to refill."""
+        mock_time.monotonic.return_value = 100.0
+        limiter = RateLimiter(60, burst=1)
         
-        llm = TestLLM()
+        limiter.acquire()
+        limiter.acquire()
         
-        with pytest.raises(ValueError, match="Text must be a string"):
-            llm.validate_text(123)
+        mock_time.sleep.assert_called_once_with(pytest.approx(1.0))
+    
+    @patch('src.llm.rate_limiter.time')
+    def test_acquire_refills_over_time(self, mock_time):
+        """Test the bucket refills at the configured rate."""
+        mock_time.monotonic.return_value = 100.0
+        limiter = RateLimiter(60, burst=1)
+        limiter.acquire()
+        
+        mock_time.monotonic.return_value = 101.0
+        limiter.acquire()
         
-        # Test with different non-string types to ensure full coverage
-        with pytest.raises(ValueError, match="Text must be a string"):
-            llm.validate_text([])
-        with pytest.raises(ValueError, match="Text must be a string"):
-            llm.validate_text({})
+        mock_time.sleep.assert_not_called()
     
-    def test_validate_text_empty(self):
-        """Test validate_text raises ValueError for empty string."""
-        class TestLLM(LLMInterface):
-            def generate_response(self, prompt: str, **kwargs) -> str:
-                return ""
+    @patch('src.llm.rate_limiter.asyncio.sleep', new_callable=AsyncMock)
+    def test_acquire_async_beyond_burst_waits(self, mock_sleep):
+        """Test acquire_async awaits instead of blocking when the bucket is empty."""
+        limiter = RateLimiter(60, burst=1)
         
-        llm = TestLLM()
+        asyncio.run(limiter.acquire_async())
+        asyncio.run(limiter.acquire_async())
         
-        with pytest.raises(ValueError, match="Text cannot be empty"):
-            llm.validate_text("")
-        with pytest.raises(ValueError, match="Text cannot be empty"):
-            llm.validate_text("   ")
+        mock_sleep.assert_awaited_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(1.0, abs=0.1)
 
 
 class TestGeminiLLM:
     """Test cases for GeminiLLM."""
     
-    @patch.dict(os.environ, {'GEMINI_API_KEY': 'test-api-key'})
-    @patch('src.llm.gemini_llm.genai')
-    def test_init_with_env_var(self, mock_genai):
+    def test_init_with_env_var(self, mocker, monkeypatch):
         """Test GeminiLLM initialization with environment variable."""
+        monkeypatch.setenv('GEMINI_API_KEY', 'test-api-key')
+        mock_genai = mocker.patch('src.llm.gemini_llm.genai')
         mock_client = Mock()
         mock_genai.Client.return_value = mock_client
         
@@ -109,146 +234,212 @@ class TestGeminiLLM:
         
         assert llm.api_key == 'test-api-key'
         assert llm.model_name == 'models/gemini-2.0-flash-lite'
-        mock_genai.Client.assert_called_once_with(api_key='test-api-key')
+        mock_genai.Client.assert_called_once_with(api_key='test-api-key', http_options={'timeout': 30000})
         assert llm.client == mock_client
     
-    @patch('src.llm.gemini_llm.genai')
-    def test_init_with_api_key_parameter(self, mock_genai):
+    def test_init_with_api_key_parameter(self, mocker):
         """Test GeminiLLM initialization with API key parameter."""
+        mock_genai = mocker.patch('src.llm.gemini_llm.genai')
         mock_client = Mock()
         mock_genai.Client.return_value = mock_client
         
         llm = GeminiLLM(api_key='custom-api-key')
         
         assert llm.api_key == 'custom-api-key'
-        mock_genai.Client.assert_called_once_with(api_key='custom-api-key')
+        mock_genai.Client.assert_called_once_with(api_key='custom-api-key', http_options={'timeout': 30000})
     
-    @patch('src.llm.gemini_llm.genai')
-    def test_init_with_custom_model(self, mock_genai):
+    def test_init_with_custom_model(self, mocker):
         """Test GeminiLLM initialization with custom model name."""
+        mock_genai = mocker.patch('src.llm.gemini_llm.genai')
         mock_client = Mock()
         mock_genai.Client.return_value = mock_client
         
         llm = GeminiLLM(model_name='gemini-ultra', api_key='test-key')
         
         assert llm.model_name == 'gemini-ultra'
-        mock_genai.Client.assert_called_once_with(api_key='test-key')
+        mock_genai.Client.assert_called_once_with(api_key='test-key', http_options={'timeout': 30000})
+    
+    def test_init_reuses_client(self, mocker):
+        """Test GeminiLLM instances with the same API key share one client."""
+        mock_genai = mocker.patch('src.llm.gemini_llm.genai')
+        mock_genai.Client.side_effect = lambda **kwargs: Mock()
+        
+        llm1 = GeminiLLM(api_key='test-key')
+        llm2 = GeminiLLM(api_key='test-key')
+        llm3 = GeminiLLM(api_key='other-key')
+        
+        assert llm1.client is llm2.client
+        assert llm3.client is not llm1.client
+        assert mock_genai.Client.call_count == 2
     
-    @patch.dict(os.environ, {}, clear=True)
-    def test_init_no_api_key(self):
+    def test_init_no_api_key(self, monkeypatch):
         """Test GeminiLLM initialization raises ValueError when no API key provided."""
+        monkeypatch.delenv('GEMINI_API_KEY', raising=False)
         with pytest.raises(ValueError, match="Gemini API key is not set"):
             GeminiLLM()
     
-    @patch.dict(os.environ, {'GEMINI_API_KEY': 'test-api-key'})
-    @patch('src.llm.gemini_llm.genai')
-    def test_generate_response_success(self, mock_genai):
+    def test_generate_response_success(self, gemini_llm, mock_client):
         """Test successful response generation."""
         mock_response = Mock()
         mock_response.text = "Generated response"
         
-        mock_client = Mock()
         mock_client.models.generate_content.return_value = mock_response
-        mock_genai.Client.return_value = mock_client
         
-        llm = GeminiLLM()
-        result = llm.generate_response("Test prompt")
+        result = gemini_llm.generate_response("Test prompt")
         
         assert result == "Generated response"
         mock_client.models.generate_content.assert_called_once()
     
-    @patch.dict(os.environ, {'GEMINI_API_KEY': 'test-api-key'})
-    @patch('src.llm.gemini_llm.genai')
-    def test_generate_response_with_kwargs(self, mock_genai):
-        """Test response generation with custom parameters."""
+    def test_generate_response_with_history(self, gemini_llm, mock_client):
+        """Test conversation history is sent as multi-turn contents before the prompt."""
+        mock_client.models.generate_content.return_value = Mock(text="Fixed response")
+        
+        gemini_llm.generate_response("Fix it", history=[('user', "Original prompt"), ('model', "Bad response")])
+        
+        contents = mock_client.models.generate_content.call_args[1]['contents']
+        assert contents == [
+            {'role': 'user', 'parts': [{'text': "Original prompt"}]},
+            {'role': 'model', 'parts': [{'text': "Bad response"}]},
+            {'role': 'user', 'parts': [{'text': "Fix it"}]},
+        ]
+        assert 'history' not in _config_of(mock_client)
+    
+    @pytest.mark.parametrize("kwargs,expected", [
+        ({}, {'temperature': 0.0, 'max_output_tokens': 2048, 'top_p': 1.0, 'top_k': 1}),
+        (
+            {'temperature': 0.5, 'max_output_tokens': 1000},
+            {'temperature': 0.5, 'max_output_tokens': 1000, 'top_p': 1.0, 'top_k': 1}
+        ),
+    ])
+    def test_generate_response_config(self, gemini_llm, mock_client, kwargs, expected):
+        """Test response generation uses the default parameters unless overridden."""
+        mock_client.models.generate_content.return_value = Mock(text="Generated response")
+        
+        result = gemini_llm.generate_response("Test prompt", **kwargs)
+        
+        assert result == "Generated response"
+        config = _config_of(mock_client)
+        assert {key: config[key] for key in expected} == expected
+    
+    def test_generate_response_structured_output(self, gemini_llm, mock_client):
+        """Test response generation forwards structured output parameters."""
         mock_response = Mock()
-        mock_response.text = "Generated response"
+        mock_response.text = '{"name": "John Doe"}'
         
-        mock_client = Mock()
         mock_client.models.generate_content.return_value = mock_response
-        mock_genai.Client.return_value = mock_client
         
-        llm = GeminiLLM()
-        result = llm.generate_response(
+        schema = Mock()
+        gemini_llm.generate_response(
             "Test prompt",
-            temperature=0.5,
-            max_output_tokens=1000
+            response_mime_type='application/json',
+            response_schema=schema
         )
         
-        assert result == "Generated response"
-        call_args = mock_client.models.generate_content.call_args
-        assert call_args[1]['config']['temperature'] == 0.5
-        assert call_args[1]['config']['max_output_tokens'] == 1000
-    
-    @patch.dict(os.environ, {'GEMINI_API_KEY': 'test-api-key'})
-    @patch('src.llm.gemini_llm.genai')
-    def test_generate_response_default_parameters(self, mock_genai):
-        """Test response generation uses default parameters."""
+        config = _config_of(mock_client)
+        assert config['response_mime_type'] == 'application/json'
+        assert config['response_schema'] is schema
+    
+    @pytest.mark.parametrize("error_message,expected_error,match", [
+        ("Invalid API key", ConnectionError, "Failed to authenticate"),
+        ("Network connection failed", ConnectionError, "Failed to connect"),
+        ("Unknown error", RuntimeError, "Error generating response"),
+    ])
+    def test_generate_response_errors(self, gemini_llm, mock_client, error_message, expected_error, match):
+        """Test generate_response wraps authentication, network and other errors."""
+        mock_client.models.generate_content.side_effect = Exception(error_message)
+        
+        with pytest.raises(expected_error, match=match):
+            gemini_llm.generate_response("Test prompt")
+    
+    def test_generate_response_invalid_prompt(self, gemini_llm):
+        """Test generate_response raises ValueError for invalid prompt."""
+        with pytest.raises(ValueError, match="Prompt cannot be empty"):
+            gemini_llm.generate_response("")
+    
+    def test_generate_response_async_success(self, gemini_llm, mock_client):
+        """Test async response generation uses the async client."""
         mock_response = Mock()
         mock_response.text = "Generated response"
         
-        mock_client = Mock()
-        mock_client.models.generate_content.return_value = mock_response
-        mock_genai.Client.return_value = mock_client
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
         
-        llm = GeminiLLM()
-        llm.generate_response("Test prompt")
-        
-        call_args = mock_client.models.generate_content.call_args
-        config = call_args[1]['config']
-        assert config['temperature'] == 0.7
-        assert config['max_output_tokens'] == 2048
-        assert config['top_p'] == 0.8
-        assert config['top_k'] == 40
-    
-    @patch.dict(os.environ, {'GEMINI_API_KEY': 'test-api-key'})
-    @patch('src.llm.gemini_llm.genai')
-    def test_generate_response_authentication_error(self, mock_genai):
-        """Test generate_response raises ConnectionError for authentication errors."""
-        mock_client = Mock()
-        mock_client.models.generate_content.side_effect = Exception("Invalid API key")
-        mock_genai.Client.return_value = mock_client
+        result = asyncio.run(gemini_llm.generate_response_async("Test prompt", temperature=0.5))
         
-        llm = GeminiLLM()
+        assert result == "Generated response"
+        mock_client.aio.models.generate_content.assert_awaited_once()
+        assert _config_of(mock_client.aio)['temperature'] == 0.5
+        mock_client.models.generate_content.assert_not_called()
+    
+    def test_generate_response_async_client_per_event_loop(self, mocker):
+        """Test each event loop gets its own async client, separate from the shared sync client."""
+        def make_client(**kwargs):
+            client = Mock()
+            client.aio.models.generate_content = AsyncMock(return_value=Mock(text="Generated response"))
+            return client
+        
+        mock_genai = mocker.patch('src.llm.gemini_llm.genai')
+        mock_genai.Client.side_effect = make_client
+        llm = GeminiLLM(api_key='test-key')
+        
+        async def generate_twice():
+            await llm.generate_response_async("Test prompt")
+            await llm.generate_response_async("Test prompt")
+        
+        asyncio.run(generate_twice())
+        asyncio.run(generate_twice())
+        
+        # One shared sync client and one async client per loop.
+        assert mock_genai.Client.call_count == 3
+        llm.client.aio.models.generate_content.assert_not_awaited()
+    
+    def test_generate_response_async_network_error(self, gemini_llm, mock_client):
+        """Test generate_response_async raises ConnectionError for network errors."""
+        mock_client.aio.models.generate_content = AsyncMock(side_effect=Exception("Network connection failed"))
         
-        with pytest.raises(ConnectionError, match="Failed to authenticate"):
-            llm.generate_response("Test prompt")
+        with pytest.raises(ConnectionError, match="Failed to connect"):
+            asyncio.run(gemini_llm.generate_response_async("Test prompt"))
     
-    @patch.dict(os.environ, {'GEMINI_API_KEY': 'test-api-key'})
-    @patch('src.llm.gemini_llm.genai')
-    def test_generate_response_network_error(self, mock_genai):
-        """Test generate_response raises ConnectionError for network errors."""
-        mock_client = Mock()
-        mock_client.models.generate_content.side_effect = Exception("Network connection failed")
-        mock_genai.Client.return_value = mock_client
+    def test_generate_response_uses_cache(self, mock_client, tmp_path):
+        """Test repeated prompts are served from the cache."""
+        mock_response = Mock()
+        mock_response.text = "Generated response"
         
-        llm = GeminiLLM()
+        mock_client.models.generate_content.return_value = mock_response
         
-        with pytest.raises(ConnectionError, match="Failed to connect"):
-            llm.generate_response("Test prompt")
+        llm = GeminiLLM(cache=LLMCache(tmp_path))
+        
+        assert llm.generate_response("Test prompt") == "Generated response"
+        assert llm.generate_response("Test prompt") == "Generated response"
+        mock_client.models.generate_content.assert_called_once()
+        
+        llm.generate_response("Test prompt", temperature=0.5)
+        assert mock_client.models.generate_content.call_count == 2
+        
+        llm.generate_response("Test prompt", history=[('user', "Earlier prompt"), ('model', "Earlier response")])
+        assert mock_client.models.generate_content.call_count == 3
     
-    @patch.dict(os.environ, {'GEMINI_API_KEY': 'test-api-key'})
-    @patch('src.llm.gemini_llm.genai')
-    def test_generate_response_runtime_error(self, mock_genai):
-        """Test generate_response raises RuntimeError for other errors."""
-        mock_client = Mock()
+    def test_generate_response_does_not_cache_errors(self, mock_client, tmp_path):
+        """Test failed requests are not written to the cache."""
         mock_client.models.generate_content.side_effect = Exception("Unknown error")
-        mock_genai.Client.return_value = mock_client
         
-        llm = GeminiLLM()
+        llm = GeminiLLM(cache=LLMCache(tmp_path))
         
-        with pytest.raises(RuntimeError, match="Error generating response"):
+        with pytest.raises(RuntimeError):
             llm.generate_response("Test prompt")
+        assert list(tmp_path.iterdir()) == []
     
-    @patch.dict(os.environ, {'GEMINI_API_KEY': 'test-api-key'})
-    @patch('src.llm.gemini_llm.genai')
-    def test_generate_response_invalid_prompt(self, mock_genai):
-        """Test generate_response raises ValueError for invalid prompt."""
-        mock_client = Mock()
-        mock_genai.Client.return_value = mock_client
+    def test_generate_response_rate_limited(self, mock_client):
+        """Test requests are throttled when a request quota is configured."""
+        mock_response = Mock()
+        mock_response.text = "Generated response"
         
-        llm = GeminiLLM()
+        mock_client.models.generate_content.return_value = mock_response
         
-        with pytest.raises(ValueError, match="Prompt cannot be empty"):
-            llm.generate_response("")
-
+        llm = GeminiLLM(requests_per_minute=500)
+        assert llm.rate_limiter.requests_per_minute == 500
+        
+        with patch.object(llm.rate_limiter, 'acquire') as mock_acquire:
+            llm.generate_response("Test prompt")
+        
+        mock_acquire.assert_called_once()
+        mock_client.models.generate_content.assert_called_once()
@@ -30,33 +30,11 @@ class TestResumeData:
         assert resume.email == "jane.smith@example.com"
         assert resume.skills == []
     
-    def test_resume_data_equality(self):
-        """Test ResumeData equality comparison."""
-        resume1 = ResumeData(
-            name="John Doe",
-            email="john.doe@example.com",
-            skills=["Python"]
-        )
-        resume2 = ResumeData(
-            name="John Doe",
-            email="john.doe@example.com",
-            skills=["Python"]
-        )
-        
-        assert resume1 == resume2
-    
-    def test_resume_data_inequality(self):
-        """Test ResumeData inequality comparison."""
-        resume1 = ResumeData(
-            name="John Doe",
-            email="john.doe@example.com",
-            skills=["Python"]
-        )
-        resume2 = ResumeData(
-            name="Jane Smith",
-            email="jane.smith@example.com",
-            skills=["Java"]
-        )
-        
-        assert resume1 != resume2
-
+    @pytest.mark.parametrize("first,second,expected_equal", [
+        (("John Doe", "john.doe@example.com", ["Python"]), ("John Doe", "john.doe@example.com", ["Python"]), True),
+        (("John Doe", "john.doe@example.com", ["Python"]), ("Jane Smith", "jane.smith@example.com", ["Java"]), False),
+        (("John Doe", "john.doe@example.com", ["Python"]), ("John Doe", "john.doe@example.com", ["Java"]), False),
+    ])
+    def test_resume_data_equality(self, first, second, expected_equal):
+        """Test ResumeData equality compares every field."""
+        assert (ResumeData(*first) == ResumeData(*second)) is expected_equal
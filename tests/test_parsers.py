@@ -1,290 +1,467 @@
 """Tests for file parsers."""
 
+import io
+import itertools
+import zipfile
+from types import SimpleNamespace
+
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
-import pypdf
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 
+from src.parsers.file_parser import FileParser
 from src.parsers.pdf_parser import PDFParser
-from src.parsers.word_parser import WordParser
+from src.parsers.word_parser import WordParser, _parse_one
+
+# Page texts of the shared mock PdfReader and the text PDFParser builds from them.
+_PAGE_TEXTS = ("Page 1 content", "Page 2 content")
+_EXPECTED_PAGES_TEXT = "\n".join(_PAGE_TEXTS)
+
+# Rows of the table shared by the Word table tests; variants extend a copy.
+_TABLE_ROWS = [["Cell 1", "Cell 2"]]
+_EXPECTED_ROW_TEXT = " | ".join(_TABLE_ROWS[0])
+
+# Namespaces of text box markup that python-docx's nsmap does not declare.
+_TEXT_BOX_NSDECLS = (
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" '
+    'xmlns:v="urn:schemas-microsoft-com:vml"'
+)
+
+# Numbers the files created in session_tmp; each xdist worker has its own basetemp.
+_tmp_file_ids = itertools.count()
+
+
+def _pdf_page(text):
+    """Build a stand-in for a pypdf page whose extract_text() returns text."""
+    return SimpleNamespace(extract_text=lambda: text)
+
+
+def _docx_bytes(paragraphs=(), tables=()):
+    """Build a real .docx document with the given paragraphs and tables (lists of rows)."""
+    document = Document()
+    for text in paragraphs:
+        document.add_paragraph(text)
+    for rows in tables:
+        table = document.add_table(rows=len(rows), cols=max(len(row) for row in rows))
+        for row_index, row in enumerate(rows):
+            for column_index, text in enumerate(row):
+                table.cell(row_index, column_index).text = text
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+_SHARED_OPEN_MOCK = mock_open(read_data=b"fake pdf content")
+
+
+@pytest.fixture
+def mock_file(pdf_path):
+    """
+    Patch open() with a mock_open built once per module, with its recorded calls reset.
+    
+    On teardown, checks that the test opened pdf_path for binary reading exactly once.
+    """
+    _SHARED_OPEN_MOCK.reset_mock()
+    with patch('builtins.open', new=_SHARED_OPEN_MOCK):
+        yield _SHARED_OPEN_MOCK
+    _SHARED_OPEN_MOCK.assert_called_once_with(pdf_path, 'rb')
+
+
+@pytest.fixture
+def pdf_path():
+    """A test.pdf path that is never created, for tests that mock open(); validation is patched out."""
+    with patch.object(PDFParser, 'validate_file') as mock_validate_file:
+        yield Path("test.pdf")
+    mock_validate_file.assert_called_once_with(Path("test.pdf"))
+
+
+@pytest.fixture(scope="session")
+def session_tmp(tmp_path_factory):
+    """One temporary directory shared by every parser test in the session."""
+    return tmp_path_factory.mktemp("parsers")
+
+
+@pytest.fixture
+def make_tmp_path(session_tmp):
+    """Return a factory for unique, not yet created file paths in session_tmp."""
+    def make(suffix=".docx"):
+        return session_tmp / f"file{next(_tmp_file_ids)}{suffix}"
+    return make
+
+
+@pytest.fixture(scope="module")
+def tmp_docx_file(session_tmp):
+    """A valid, empty test.docx written once per module, for tests that mock the archive reading."""
+    file_path = session_tmp / "test.docx"
+    file_path.write_bytes(_docx_bytes())
+    return file_path
+
+
+@pytest.fixture(scope="module")
+def pdf_reader_template():
+    """A two-page mock PdfReader built once per module; tests must not reconfigure it."""
+    return SimpleNamespace(pages=[_pdf_page(text) for text in _PAGE_TEXTS])
 
 
 class TestPDFParser:
     """Test cases for PDFParser."""
     
-    def test_init(self):
-        """Test PDFParser initialization."""
-        parser = PDFParser()
-        assert parser._supported_extensions == ['.pdf']
+    @pytest.fixture(scope="class")
+    @classmethod
+    def parser(cls):
+        """A PDFParser shared by the tests of this class; parsers hold no per-file state."""
+        return PDFParser()
     
-    def test_get_supported_extensions(self):
-        """Test getting supported extensions."""
-        parser = PDFParser()
-        extensions = parser.get_supported_extensions()
-        assert extensions == ['.pdf']
-        # Ensure it returns a copy
-        extensions.append('.docx')
-        assert parser.get_supported_extensions() == ['.pdf']
+    @pytest.fixture(autouse=True)
+    def mock_pdf_reader(self, monkeypatch):
+        """Replace pypdf.PdfReader for every test of this class."""
+        mock_reader = Mock()
+        monkeypatch.setattr('src.parsers.pdf_parser.pypdf.PdfReader', mock_reader)
+        return mock_reader
     
-    def test_can_parse_pdf_file(self):
-        """Test can_parse returns True for PDF files."""
-        parser = PDFParser()
-        file_path = Path("test.pdf")
-        assert parser.can_parse(file_path) is True
+    @pytest.mark.parametrize("name", ["test.pdf", "test.PDF", "test.Pdf"])
+    def test_can_parse_pdf_file(self, parser, name):
+        """Test can_parse returns True for PDF files, case insensitively."""
+        assert parser.can_parse(Path(name)) is True
     
-    def test_can_parse_non_pdf_file(self):
+    def test_can_parse_non_pdf_file(self, parser):
         """Test can_parse returns False for non-PDF files."""
-        parser = PDFParser()
         file_path = Path("test.docx")
         assert parser.can_parse(file_path) is False
     
-    def test_can_parse_case_insensitive(self):
-        """Test can_parse is case insensitive."""
-        parser = PDFParser()
-        assert parser.can_parse(Path("test.PDF")) is True
-        assert parser.can_parse(Path("test.Pdf")) is True
-    
-    def test_validate_file_not_found(self):
-        """Test validate_file raises FileNotFoundError for non-existent file."""
-        parser = PDFParser()
-        file_path = Path("nonexistent.pdf")
-        
-        with pytest.raises(FileNotFoundError):
-            parser.validate_file(file_path)
-    
-    def test_validate_file_is_directory(self, tmp_path):
-        """Test validate_file raises ValueError for directory."""
-        parser = PDFParser()
-        dir_path = tmp_path / "test_dir"
-        dir_path.mkdir()
-        
-        with pytest.raises(ValueError, match="Path is not a file"):
-            parser.validate_file(dir_path)
-    
-    def test_validate_file_empty(self, tmp_path):
-        """Test validate_file raises ValueError for empty file."""
-        parser = PDFParser()
-        file_path = tmp_path / "empty.pdf"
-        file_path.touch()
-        
-        with pytest.raises(ValueError, match="File is empty"):
-            parser.validate_file(file_path)
-    
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('src.parsers.pdf_parser.pypdf.PdfReader')
-    def test_parse_success(self, mock_pdf_reader, mock_file, tmp_path):
+    def test_parse_success(self, mock_pdf_reader, mock_file, parser, pdf_path, pdf_reader_template):
         """Test successful PDF parsing."""
-        parser = PDFParser()
-        file_path = tmp_path / "test.pdf"
-        file_path.write_bytes(b"fake pdf content")
+        mock_pdf_reader.return_value = pdf_reader_template
         
-        # Mock PDF reader
-        mock_page1 = Mock()
-        mock_page1.extract_text.return_value = "Page 1 content"
-        mock_page2 = Mock()
-        mock_page2.extract_text.return_value = "Page 2 content"
+        result = parser.parse(pdf_path)
         
-        mock_reader_instance = Mock()
-        mock_reader_instance.pages = [mock_page1, mock_page2]
-        mock_pdf_reader.return_value = mock_reader_instance
+        assert result == _EXPECTED_PAGES_TEXT
+        mock_pdf_reader.assert_called_once()
+        assert mock_pdf_reader.call_args.kwargs == {'strict': False}
+    
+    def test_parse_page_without_text(self, mock_pdf_reader, mock_file, parser, pdf_path):
+        """Test pages without extractable text are treated as empty."""
+        mock_pdf_reader.return_value.pages = [_pdf_page(None), _pdf_page("Page 2 content")]
         
-        result = parser.parse(file_path)
+        result = parser.parse(pdf_path)
         
-        assert result == "Page 1 content\nPage 2 content"
-        mock_file.assert_called_once()
-        mock_pdf_reader.assert_called_once()
+        assert result == "\nPage 2 content"
     
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('src.parsers.pdf_parser.pypdf.PdfReader')
-    def test_parse_invalid_pdf(self, mock_pdf_reader, mock_file, tmp_path):
+    def test_parse_invalid_pdf(self, mock_pdf_reader, mock_file, parser, pdf_path):
         """Test parsing invalid PDF raises ValueError."""
-        parser = PDFParser()
-        file_path = tmp_path / "invalid.pdf"
-        file_path.write_bytes(b"invalid content")
+        from pypdf.errors import PdfReadError
         
-        mock_pdf_reader.side_effect = pypdf.errors.PdfReadError("Invalid PDF")
+        mock_pdf_reader.side_effect = PdfReadError("Invalid PDF")
         
         with pytest.raises(ValueError, match="Invalid PDF file"):
-            parser.parse(file_path)
+            parser.parse(pdf_path)
     
-    @patch('builtins.open', new_callable=mock_open)
-    def test_parse_io_error(self, mock_file, tmp_path):
+    @patch('builtins.open', side_effect=IOError("Cannot read file"))
+    def test_parse_io_error(self, mock_builtin_open, parser, pdf_path):
         """Test parsing raises IOError on file read error."""
-        parser = PDFParser()
-        file_path = tmp_path / "test.pdf"
-        file_path.write_bytes(b"content")
+        with pytest.raises(IOError, match="Error reading PDF file"):
+            parser.parse(pdf_path)
+    
+    def test_parse_bytes(self, mock_pdf_reader, parser, pdf_reader_template):
+        """Test parsing PDF content that is already in memory."""
+        streamed = []
         
-        mock_file.side_effect = IOError("Cannot read file")
+        def read_stream(stream, strict):
+            streamed.append(stream.read())
+            return SimpleNamespace(pages=pdf_reader_template.pages[:1])
         
-        with pytest.raises(IOError, match="Error reading PDF file"):
-            parser.parse(file_path)
+        mock_pdf_reader.side_effect = read_stream
+        
+        result = parser.parse_bytes(b"fake pdf content", Path("test.pdf"))
+        
+        assert result == _PAGE_TEXTS[0]
+        assert streamed == [b"fake pdf content"]
+    
+    def test_parse_bytes_empty(self, parser):
+        """Test parse_bytes raises ValueError for empty content."""
+        with pytest.raises(ValueError, match="File is empty"):
+            parser.parse_bytes(b"", Path("test.pdf"))
 
 
 class TestWordParser:
     """Test cases for WordParser."""
     
-    def test_init(self):
-        """Test WordParser initialization."""
-        parser = WordParser()
-        assert parser._supported_extensions == ['.docx']
+    @pytest.fixture(scope="class")
+    @classmethod
+    def parser(cls):
+        """A WordParser shared by the tests of this class; parsers hold no per-file state."""
+        return WordParser()
     
-    def test_get_supported_extensions(self):
-        """Test getting supported extensions."""
-        parser = WordParser()
-        extensions = parser.get_supported_extensions()
-        assert extensions == ['.docx']
-        # Ensure it returns a copy
-        extensions.append('.pdf')
-        assert parser.get_supported_extensions() == ['.docx']
-    
-    def test_can_parse_docx_file(self):
-        """Test can_parse returns True for DOCX files."""
-        parser = WordParser()
-        file_path = Path("test.docx")
-        assert parser.can_parse(file_path) is True
+    @pytest.mark.parametrize("name", ["test.docx", "test.DOCX", "test.Docx"])
+    def test_can_parse_docx_file(self, parser, name):
+        """Test can_parse returns True for DOCX files, case insensitively."""
+        assert parser.can_parse(Path(name)) is True
     
-    def test_can_parse_non_docx_file(self):
+    def test_can_parse_non_docx_file(self, parser):
         """Test can_parse returns False for non-DOCX files."""
-        parser = WordParser()
         file_path = Path("test.pdf")
         assert parser.can_parse(file_path) is False
     
-    def test_can_parse_case_insensitive(self):
-        """Test can_parse is case insensitive."""
-        parser = WordParser()
-        assert parser.can_parse(Path("test.DOCX")) is True
-        assert parser.can_parse(Path("test.Docx")) is True
-    
-    def test_validate_file_not_found(self):
-        """Test validate_file raises FileNotFoundError for non-existent file."""
-        parser = WordParser()
-        file_path = Path("nonexistent.docx")
-        
-        with pytest.raises(FileNotFoundError):
-            parser.validate_file(file_path)
-    
-    def test_validate_file_is_directory(self, tmp_path):
-        """Test validate_file raises ValueError for directory."""
-        parser = WordParser()
-        dir_path = tmp_path / "test_dir"
-        dir_path.mkdir()
-        
-        with pytest.raises(ValueError, match="Path is not a file"):
-            parser.validate_file(dir_path)
-    
-    def test_validate_file_empty(self, tmp_path):
-        """Test validate_file raises ValueError for empty file."""
-        parser = WordParser()
-        file_path = tmp_path / "empty.docx"
-        file_path.touch()
-        
-        with pytest.raises(ValueError, match="File is empty"):
-            parser.validate_file(file_path)
-    
-    @patch('src.parsers.word_parser.Document')
-    def test_parse_success_with_paragraphs(self, mock_document, tmp_path):
+    def test_parse_success_with_paragraphs(self, parser, make_tmp_path):
         """Test successful Word document parsing with paragraphs."""
-        parser = WordParser()
-        file_path = tmp_path / "test.docx"
-        file_path.write_bytes(b"fake docx content")
-        
-        # Mock document
-        mock_doc = Mock()
-        mock_doc.paragraphs = [
-            Mock(text="Paragraph 1"),
-            Mock(text=""),
-            Mock(text="Paragraph 2"),
-            Mock(text="   "),  # Whitespace only
-        ]
-        mock_doc.tables = []
-        mock_document.return_value = mock_doc
+        file_path = make_tmp_path()
+        file_path.write_bytes(_docx_bytes(paragraphs=["Paragraph 1", "", "Paragraph 2", "   "]))
         
         result = parser.parse(file_path)
         
         assert result == "Paragraph 1\nParagraph 2"
-        mock_document.assert_called_once_with(file_path)
     
-    @patch('src.parsers.word_parser.Document')
-    def test_parse_success_with_tables(self, mock_document, tmp_path):
+    def test_parse_success_with_tables(self, parser, make_tmp_path):
         """Test successful Word document parsing with tables."""
-        parser = WordParser()
-        file_path = tmp_path / "test.docx"
-        file_path.write_bytes(b"fake docx content")
-        
-        # Mock document with tables
-        mock_doc = Mock()
-        mock_doc.paragraphs = [Mock(text="Paragraph 1")]
-        
-        # Mock table
-        mock_cell1 = Mock(text="Cell 1")
-        mock_cell2 = Mock(text="  Cell 2  ")
-        mock_cell3 = Mock(text="")
-        mock_row = Mock(cells=[mock_cell1, mock_cell2, mock_cell3])
-        mock_table = Mock(rows=[mock_row])
-        mock_doc.tables = [mock_table]
-        
-        mock_document.return_value = mock_doc
+        file_path = make_tmp_path()
+        file_path.write_bytes(_docx_bytes(
+            paragraphs=["Paragraph 1"],
+            tables=[[["Cell 1", "  Cell 2  ", ""]]]
+        ))
         
         result = parser.parse(file_path)
         
         assert "Paragraph 1" in result
-        assert "Cell 1 | Cell 2" in result
-        mock_document.assert_called_once_with(file_path)
+        assert _EXPECTED_ROW_TEXT in result
     
-    @patch('src.parsers.word_parser.Document')
-    def test_parse_success_with_paragraphs_and_tables(self, mock_document, tmp_path):
+    def test_parse_success_with_paragraphs_and_tables(self, parser, make_tmp_path):
         """Test successful Word document parsing with both paragraphs and tables."""
-        parser = WordParser()
-        file_path = tmp_path / "test.docx"
-        file_path.write_bytes(b"fake docx content")
+        file_path = make_tmp_path()
+        file_path.write_bytes(_docx_bytes(paragraphs=["Paragraph 1"], tables=[_TABLE_ROWS]))
         
-        mock_doc = Mock()
-        mock_doc.paragraphs = [Mock(text="Paragraph 1")]
+        result = parser.parse(file_path)
         
-        mock_row = Mock(cells=[Mock(text="Cell 1"), Mock(text="Cell 2")])
-        mock_table = Mock(rows=[mock_row])
-        mock_doc.tables = [mock_table]
+        assert result == f"Paragraph 1\n\n{_EXPECTED_ROW_TEXT}"
+    
+    def test_parse_tables_only(self, parser):
+        """Test a document with only tables has no leading blank lines."""
+        result = parser.parse_bytes(
+            _docx_bytes(tables=[_TABLE_ROWS + [["", ""], ["Cell 3", ""]]]), Path("test.docx")
+        )
         
-        mock_document.return_value = mock_doc
+        assert result == f"{_EXPECTED_ROW_TEXT}\nCell 3"
+    
+    def test_parse_runs_tabs_and_breaks(self, parser, make_tmp_path):
+        """Test run text, tabs and line breaks are extracted like python-docx's Paragraph.text."""
+        document = Document()
+        paragraph = document.add_paragraph("Python")
+        paragraph.add_run("\tJava").add_break()
+        paragraph.add_run("SQL")
+        document.add_table(rows=1, cols=1).cell(0, 0).text = "Line 1\nLine 2"
+        file_path = make_tmp_path()
+        document.save(file_path)
         
         result = parser.parse(file_path)
         
-        assert result == "Paragraph 1\n\nCell 1 | Cell 2"
+        assert result == "Python\tJava\nSQL\n\nLine 1\nLine 2"
     
-    @patch('src.parsers.word_parser.Document')
-    def test_parse_io_error(self, mock_document, tmp_path):
-        """Test parsing raises IOError on document read error."""
-        parser = WordParser()
-        file_path = tmp_path / "test.docx"
-        file_path.write_bytes(b"content")
+    def test_parse_skips_text_boxes(self, parser, make_tmp_path):
+        """Test text boxes are skipped and other run content is rendered like python-docx's Paragraph.text."""
+        text_box = '<w:txbxContent><w:p><w:r><w:t>Sidebar Skills</w:t></w:r></w:p></w:txbxContent>'
+        document = Document()
+        paragraph = document.add_paragraph("Main para")
+        paragraph._p.append(parse_xml(
+            f'<w:r {nsdecls("w")} {_TEXT_BOX_NSDECLS}><mc:AlternateContent>'
+            f'<mc:Choice Requires="wps"><w:drawing><wps:txbx>{text_box}</wps:txbx></w:drawing></mc:Choice>'
+            f'<mc:Fallback><w:pict><v:textbox>{text_box}</v:textbox></w:pict></mc:Fallback>'
+            '</mc:AlternateContent></w:r>'
+        ))
+        paragraph._p.append(parse_xml(
+            f'<w:hyperlink {nsdecls("w")}><w:r><w:t> e</w:t><w:noBreakHyphen/><w:t>mail</w:t>'
+            '<w:ptab w:relativeTo="margin" w:alignment="right" w:leader="none"/><w:t>x</w:t></w:r></w:hyperlink>'
+        ))
+        file_path = make_tmp_path()
+        document.save(file_path)
         
-        mock_document.side_effect = IOError("Cannot read document")
+        result = parser.parse(file_path)
+        
+        assert result == "Main para e-mail\tx"
+        assert result == paragraph.text
+    
+    @pytest.mark.parametrize("error,expected_error,match", [
+        (IOError("Cannot read document"), IOError, "Error reading Word document"),
+        (FileNotFoundError("File not found"), FileNotFoundError, "File not found"),
+        (ValueError("Invalid value"), ValueError, "Invalid value"),
+    ], ids=["io_error", "file_not_found", "value_error"])
+    def test_parse_archive_errors(self, parser, tmp_docx_file, error, expected_error, match):
+        """Test read errors become IOError while FileNotFoundError and ValueError are preserved."""
+        with patch('src.parsers.word_parser.zipfile.ZipFile', side_effect=error):
+            with pytest.raises(expected_error, match=match):
+                parser.parse(tmp_docx_file)
+    
+    def test_parse_invalid_docx(self, parser, make_tmp_path):
+        """Test content that is not a .docx archive raises ValueError without being parsed."""
+        file_path = make_tmp_path()
+        file_path.write_bytes(b"not a zip archive")
+        
+        with patch('src.parsers.word_parser.zipfile.ZipFile') as mock_zipfile:
+            with pytest.raises(ValueError, match="Invalid Word document"):
+                parser.parse(file_path)
+            mock_zipfile.assert_not_called()
+    
+    def test_parse_corrupt_docx(self, parser, make_tmp_path):
+        """Test a corrupt archive raises IOError."""
+        file_path = make_tmp_path()
+        file_path.write_bytes(b"PK\x03\x04 truncated archive")
         
         with pytest.raises(IOError, match="Error reading Word document"):
             parser.parse(file_path)
     
-    @patch('src.parsers.word_parser.Document')
-    def test_parse_preserves_file_not_found_error(self, mock_document, tmp_path):
-        """Test parsing preserves FileNotFoundError."""
-        parser = WordParser()
-        file_path = tmp_path / "test.docx"
-        file_path.write_bytes(b"content")
-        
-        mock_document.side_effect = FileNotFoundError("File not found")
-        
-        with pytest.raises(FileNotFoundError):
+    @pytest.mark.parametrize("setup, error, message", [
+        (lambda path: None, FileNotFoundError, "File not found"),
+        (lambda path: path.mkdir(), ValueError, "Path is not a file"),
+        (lambda path: path.touch(), ValueError, "File is empty"),
+    ])
+    def test_parse_validates_file(self, parser, make_tmp_path, setup, error, message):
+        """Test parse reports missing files, directories and empty files from its single read."""
+        file_path = make_tmp_path()
+        setup(file_path)
+        
+        with pytest.raises(error, match=message):
             parser.parse(file_path)
     
-    @patch('src.parsers.word_parser.Document')
-    def test_parse_preserves_value_error(self, mock_document, tmp_path):
-        """Test parsing preserves ValueError."""
-        parser = WordParser()
-        file_path = tmp_path / "test.docx"
-        file_path.write_bytes(b"content")
+    def test_parse_main_part_from_relationships(self, parser, make_tmp_path):
+        """Test the main document part is located through the package relationships."""
+        source = zipfile.ZipFile(io.BytesIO(_docx_bytes(paragraphs=["Paragraph 1"])))
+        file_path = make_tmp_path()
+        with zipfile.ZipFile(file_path, 'w') as archive:
+            for name in source.namelist():
+                data = source.read(name)
+                if name == '_rels/.rels':
+                    data = data.replace(b'word/document.xml', b'word/document2.xml')
+                archive.writestr('word/document2.xml' if name == 'word/document.xml' else name, data)
+        
+        assert parser.parse(file_path) == "Paragraph 1"
+    
+    def test_parse_bytes(self, parser):
+        """Test parsing Word content that is already in memory."""
+        result = parser.parse_bytes(_docx_bytes(paragraphs=["Paragraph 1"]), Path("test.docx"))
+        
+        assert result == "Paragraph 1"
+    
+    def test_parse_bytes_empty(self, parser):
+        """Test parse_bytes raises ValueError for empty content."""
+        with pytest.raises(ValueError, match="File is empty"):
+            parser.parse_bytes(b"", Path("test.docx"))
+    
+    def test_parse_caches_by_content(self, parser, make_tmp_path):
+        """Test documents with identical content are only parsed once."""
+        first_path = make_tmp_path()
+        second_path = make_tmp_path()
+        first_path.write_bytes(_docx_bytes(paragraphs=["Paragraph 1"]))
+        second_path.write_bytes(first_path.read_bytes())
+        
+        with patch('src.parsers.word_parser.zipfile.ZipFile', wraps=zipfile.ZipFile) as mock_zipfile:
+            assert parser.parse(first_path) == "Paragraph 1"
+            assert WordParser().parse(second_path) == "Paragraph 1"
+            mock_zipfile.assert_called_once()
+            
+            WordParser.clear_cache()
+            parser.parse(first_path)
+            assert mock_zipfile.call_count == 2
+    
+    def test_parse_cache_distinguishes_content(self, parser):
+        """Test documents with different content are parsed separately."""
+        assert parser.parse_bytes(_docx_bytes(paragraphs=["First"]), Path("first.docx")) == "First"
+        assert parser.parse_bytes(_docx_bytes(paragraphs=["Second"]), Path("second.docx")) == "Second"
+    
+    def test_parse_many(self, parser, make_tmp_path):
+        """Test many documents are parsed in worker processes, in input order."""
+        file_paths = []
+        for index in range(3):
+            file_path = make_tmp_path()
+            file_path.write_bytes(_docx_bytes(paragraphs=[f"Resume {index}"]))
+            file_paths.append(file_path)
         
-        mock_document.side_effect = ValueError("Invalid value")
+        results = list(parser.parse_many(file_paths, max_workers=2))
         
-        with pytest.raises(ValueError):
-            parser.parse(file_path)
+        assert results == [(file_paths[0], "Resume 0"), (file_paths[1], "Resume 1"), (file_paths[2], "Resume 2")]
+    
+    def test_parse_one_collects_garbage(self, make_tmp_path):
+        """Test the parse_many worker runs a cycle collection after each document."""
+        file_path = make_tmp_path()
+        file_path.write_bytes(_docx_bytes(paragraphs=["Resume"]))
+        
+        with patch('src.parsers.word_parser.gc.collect') as mock_collect:
+            assert _parse_one(str(file_path)) == "Resume"
+            mock_collect.assert_called_once()
+            
+            with pytest.raises(FileNotFoundError):
+                _parse_one(str(make_tmp_path()))
+            assert mock_collect.call_count == 2
+    
+    def test_parse_many_propagates_errors(self, parser, make_tmp_path):
+        """Test parse_many raises the error of a document that cannot be parsed."""
+        file_path = make_tmp_path()
+        
+        with pytest.raises(FileNotFoundError):
+            list(parser.parse_many([file_path], max_workers=1))
+    
+    def test_parse_many_invalid_max_workers(self, parser):
+        """Test parse_many raises ValueError for a non-positive max_workers when called, not when iterated."""
+        with pytest.raises(ValueError, match="max_workers must be positive"):
+            parser.parse_many([Path("test.docx")], max_workers=0)
+
+
+class TestSupportedExtensions:
+    """Test cases for get_supported_extensions across the concrete parsers."""
+    
+    @pytest.mark.parametrize("parser_class,extensions", [(PDFParser, ['.pdf']), (WordParser, ['.docx'])])
+    def test_supported_extensions(self, parser_class, extensions):
+        """Test parsers are stateless and return a fresh copy of their supported extensions."""
+        parser = parser_class()
+        assert parser._supported_extensions == tuple(extensions)
+        assert vars(parser) == {}
+        
+        supported = parser.get_supported_extensions()
+        assert supported == extensions
+        # Ensure it returns a copy
+        supported.append('.txt')
+        assert parser.get_supported_extensions() == extensions
+
+
+class TestValidateFile:
+    """Test cases for FileParser.validate_file across the concrete parsers."""
+    
+    @pytest.mark.parametrize("parser_class,extension", [(PDFParser, ".pdf"), (WordParser, ".docx")])
+    @pytest.mark.parametrize("setup,error,message", [
+        (lambda path: None, FileNotFoundError, "File not found"),
+        (lambda path: path.mkdir(), ValueError, "Path is not a file"),
+        (lambda path: path.touch(), ValueError, "File is empty"),
+    ], ids=["missing", "directory", "empty"])
+    def test_validate_file_invalid(self, make_tmp_path, parser_class, extension, setup, error, message):
+        """Test validate_file rejects missing files, directories and empty files."""
+        file_path = make_tmp_path(extension)
+        setup(file_path)
+        
+        with pytest.raises(error, match=message):
+            parser_class().validate_file(file_path)
+
 
+class TestFileParser:
+    """Test cases for the FileParser default implementations."""
+    
+    def test_parse_bytes_default_parses_temporary_file(self):
+        """Test a parser implementing only parse() can still parse in-memory content."""
+        seen = []
+        
+        class TextParser(FileParser):
+            def parse(self, file_path):
+                seen.append(file_path)
+                return file_path.read_text()
+            
+            def can_parse(self, file_path):
+                return file_path.suffix == '.txt'
+            
+            def get_supported_extensions(self):
+                return ['.txt']
+        
+        result = TextParser().parse_bytes(b"Resume text", Path("resume.txt"))
+        
+        assert result == "Resume text"
+        assert seen[0].suffix == '.txt'
+        assert not seen[0].exists()